@@ -15,6 +15,12 @@ source .venv/bin/activate
 python -m pip install -e .
 python -m pip install pyinstaller
 
+# Optional: compile the matching hot path with mypyc; the .py stays as fallback.
+if [[ "${TJR_MYPYC:-0}" == "1" ]]; then
+  python -m pip install mypy
+  mypyc src/tjr/core/matching.py
+fi
+
 pyinstaller \
   --noconfirm \
   --clean \
@@ -8,6 +8,12 @@ if (-not (Test-Path ".venv")) {
 .\.venv\Scripts\python.exe -m pip install -e .
 .\.venv\Scripts\python.exe -m pip install pyinstaller
 
+# Optional: compile the matching hot path with mypyc; the .py stays as fallback.
+if ($env:TJR_MYPYC -eq "1") {
+  .\.venv\Scripts\python.exe -m pip install mypy
+  .\.venv\Scripts\mypyc.exe src\tjr\core\matching.py
+}
+
 if (Test-Path "dist\TJR.exe") {
   Remove-Item "dist\TJR.exe" -Force
 }
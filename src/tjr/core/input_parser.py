@@ -4,31 +4,17 @@ import re
 
 _SEPARATOR_RE = re.compile(r"[\n,;]+")
 _SEARCH_SEPARATOR_RE = re.compile(r"[\n,;/]+")
-_PUBLIC_MESSAGE_RE = re.compile(r"^https?://t\.me/(?P<chat>[^/]+)/(?P<msg_id>\d+)/?$", re.IGNORECASE)
-_PRIVATE_MESSAGE_RE = re.compile(r"^https?://t\.me/c/(?P<chat_id>\d+)/(?P<msg_id>\d+)/?$", re.IGNORECASE)
-_PUBLIC_CHAT_RE = re.compile(r"^[A-Za-z0-9_]{4,}$")
+_MESSAGE_RE = re.compile(r"https?://t\.me/(?:c/(?P<chat_id>\d+)|(?P<chat>[^/]+))/(?P<msg_id>\d+)/?")
+_SOURCE_PREFIXES = ("@", "http://", "https://", "t.me/", "-100")
 
 
 def parse_user_list_input(raw: str, *, lowercase: bool) -> list[str]:
-    chunks = _SEPARATOR_RE.split(raw)
-    cleaned: list[str] = []
-    for chunk in chunks:
-        value = chunk.strip()
-        if not value:
-            continue
-        cleaned.append(value.lower() if lowercase else value)
-    return cleaned
+    source = raw.lower() if lowercase else raw
+    return [value for value in map(str.strip, _SEPARATOR_RE.split(source)) if value]
 
 
 def parse_search_terms_text(raw: str) -> list[str]:
-    chunks = _SEARCH_SEPARATOR_RE.split(raw)
-    cleaned: list[str] = []
-    for chunk in chunks:
-        value = chunk.strip().lower()
-        if not value:
-            continue
-        cleaned.append(value)
-    return cleaned
+    return [value for value in map(str.strip, _SEARCH_SEPARATOR_RE.split(raw.lower())) if value]
 
 
 def parse_chat_sources_text(raw: str) -> list[str]:
@@ -37,68 +23,58 @@ def parse_chat_sources_text(raw: str) -> list[str]:
 
 
 def parse_chat_sources_list(values: list[str]) -> list[str]:
-    normalized: list[str] = []
-    seen: set[str] = set()
+    # Dedupe key -> first source seen; dicts keep insertion order.
+    normalized: dict[str, str] = {}
     for value in values:
         chunk = value.strip()
         if not chunk:
             continue
         for source in _split_chat_chunk(chunk):
-            key = _source_dedupe_key(source)
-            if key in seen:
-                continue
-            seen.add(key)
-            normalized.append(source)
-    return normalized
+            normalized.setdefault(_source_dedupe_key(source), source)
+    return list(normalized.values())
 
 
 def _split_chat_chunk(chunk: str) -> list[str]:
-    parts = [part.strip() for part in chunk.split() if part.strip()]
-    if len(parts) > 1 and all(_looks_like_source(part) for part in parts):
+    parts = chunk.split()
+    if len(parts) > 1 and all(map(_looks_like_source, parts)):
         return parts
     return [chunk]
 
 
 def _looks_like_source(value: str) -> bool:
-    return (
-        value.startswith("@")
-        or value.startswith("http://")
-        or value.startswith("https://")
-        or value.startswith("t.me/")
-        or value.startswith("-100")
-        or value.isdigit()
-    )
-
-
-def _source_dedupe_key(value: str) -> str:
-    source = value.strip()
-    if not source:
-        return ""
-
-    private_message = _PRIVATE_MESSAGE_RE.match(source)
-    if private_message:
-        return f"msg:c/{private_message.group('chat_id')}/{private_message.group('msg_id')}"
-
-    public_message = _PUBLIC_MESSAGE_RE.match(source)
-    if public_message:
-        chat = public_message.group("chat").lower()
-        msg_id = public_message.group("msg_id")
-        return f"msg:{chat}/{msg_id}"
+    return value.startswith(_SOURCE_PREFIXES) or value.isdigit()
 
-    lowered = source.lower()
-    if lowered.startswith("https://t.me/") or lowered.startswith("http://t.me/"):
-        path = source.split("t.me/", 1)[1].strip("/")
-        chat_ref = path.split("/", 1)[0].lstrip("@")
-        if _PUBLIC_CHAT_RE.fullmatch(chat_ref):
-            return f"chat:{chat_ref.lower()}"
-        return f"raw:{lowered}"
 
+def _source_dedupe_key(source: str) -> str:
+    # Callers pass stripped, non-empty sources.
+    lowered = source.lower()
     if source.startswith("@"):
         chat_ref = source[1:].strip()
-        if _PUBLIC_CHAT_RE.fullmatch(chat_ref):
+        if _is_public_chat_ref(chat_ref):
             return f"chat:{chat_ref.lower()}"
+        return f"raw:{lowered}"
 
-    if _PUBLIC_CHAT_RE.fullmatch(source):
-        return f"chat:{source.lower()}"
+    if not lowered.startswith(("http://", "https://")):
+        if _is_public_chat_ref(source):
+            return f"chat:{lowered}"
+        return f"raw:{lowered}"
+
+    message = _MESSAGE_RE.fullmatch(lowered)
+    if message:
+        chat_id, chat, msg_id = message.group("chat_id", "chat", "msg_id")
+        if chat_id is not None:
+            return f"msg:c/{chat_id}/{msg_id}"
+        return f"msg:{chat}/{msg_id}"
+
+    if lowered.startswith(("https://t.me/", "http://t.me/")):
+        path = source[lowered.index("t.me/") + 5 :].strip("/")
+        chat_ref = path.split("/", 1)[0].lstrip("@")
+        if _is_public_chat_ref(chat_ref):
+            return f"chat:{chat_ref.lower()}"
 
     return f"raw:{lowered}"
+
+
+def _is_public_chat_ref(value: str) -> bool:
+    # Same check as [A-Za-z0-9_]{4,} without going through the regex engine.
+    return len(value) >= 4 and value.isascii() and value.replace("_", "a").isalnum()
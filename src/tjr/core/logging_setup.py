@@ -1,17 +1,24 @@
 from __future__ import annotations
 
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
 from tjr.storage.app_paths import log_path
 
+_LISTENER: QueueListener | None = None
+_FILE_HANDLER: RotatingFileHandler | None = None
+
 
 def get_log_path() -> Path:
     return log_path()
 
 
 def configure_logging() -> Path:
+    global _FILE_HANDLER, _LISTENER
+
     log_path = get_log_path()
     log_dir = log_path.parent
     log_dir.mkdir(parents=True, exist_ok=True)
@@ -30,25 +37,33 @@ def configure_logging() -> Path:
     file_handler = RotatingFileHandler(log_path, maxBytes=1_000_000, backupCount=3, encoding="utf-8")
     file_handler.setFormatter(formatter)
 
-    logger.addHandler(file_handler)
+    # Producers only enqueue; the listener thread owns the file writes.
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _FILE_HANDLER = file_handler
+    _LISTENER = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    _LISTENER.start()
+    atexit.register(_LISTENER.stop)
+
+    logger.addHandler(QueueHandler(log_queue))
     return log_path
 
 
 def reset_log_file() -> Path:
     log_path = get_log_path()
-    logger = logging.getLogger()
 
-    for handler in logger.handlers:
-        if isinstance(handler, RotatingFileHandler) and Path(handler.baseFilename) == log_path:
-            handler.acquire()
-            try:
-                if handler.stream is not None:
-                    handler.stream.seek(0)
-                    handler.stream.truncate()
-                    handler.stream.flush()
-                    return log_path
-            finally:
-                handler.release()
+    if _LISTENER is not None and _FILE_HANDLER is not None:
+        # Drain pending records first so nothing queued before the reset lands after it.
+        _LISTENER.stop()
+        _FILE_HANDLER.acquire()
+        try:
+            if _FILE_HANDLER.stream is not None:
+                _FILE_HANDLER.stream.seek(0)
+                _FILE_HANDLER.stream.truncate()
+                _FILE_HANDLER.stream.flush()
+                return log_path
+        finally:
+            _FILE_HANDLER.release()
+            _LISTENER.start()
 
     log_path.parent.mkdir(parents=True, exist_ok=True)
     log_path.write_text("", encoding="utf-8")
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import functools
+import itertools
 import re
+import sys
 from dataclasses import dataclass
 
 from tjr.storage.config_store import JobProfileSettings
@@ -14,7 +17,7 @@ _WORD_RE = re.compile(r"[\w-]+", re.UNICODE)
 _MORPH = pymorphy3.MorphAnalyzer() if pymorphy3 is not None else None
 
 # Built-in anti-noise phrases to suppress non-vacancy content.
-_SYSTEM_EXCLUSION_PHRASES = [
+_SYSTEM_EXCLUSION_PHRASES = (
     "рекомендую кандидата",
     "рекомендую специалиста",
     "кандидат в поиске работы",
@@ -26,7 +29,7 @@ _SYSTEM_EXCLUSION_PHRASES = [
     "вебинар для",
     "обучение для",
     "мастер-класс для",
-]
+)
 
 
 @dataclass(slots=True)
@@ -43,26 +46,41 @@ class MatchResult:
     matched_exclusion_terms: list[str]
 
 
-def evaluate_message(text: str, profile: JobProfileSettings) -> MatchResult:
-    text_lemmas = set(extract_lemmas(text))
+def evaluate_message(text: str, profile: JobProfileSettings, *, fast_exclude: bool = False) -> MatchResult:
+    text_lemmas = frozenset(extract_lemmas(text, max_tokens=profile.max_message_tokens))
 
-    matched_title_terms = _matched_terms(profile.title_keywords, text_lemmas)
-    matched_profile_terms = _matched_terms(profile.profile_keywords, text_lemmas)
-    matched_industry_terms = _matched_terms(profile.industry_keywords, text_lemmas)
     matched_user_exclusion_terms = _matched_terms(profile.exclusion_phrases, text_lemmas)
-    matched_system_exclusion_terms = _matched_terms(_SYSTEM_EXCLUSION_PHRASES, text_lemmas)
+    matched_system_exclusion_terms = _matched_system_terms(text_lemmas)
     matched_exclusion_terms = _dedupe_terms(matched_user_exclusion_terms + matched_system_exclusion_terms)
 
     active_title = bool(profile.title_keywords)
     active_profile = bool(profile.profile_keywords)
     active_industry = bool(profile.industry_keywords)
+    active_criteria_count = int(active_title) + int(active_profile) + int(active_industry)
+
+    if fast_exclude and matched_exclusion_terms:
+        return MatchResult(
+            score=0,
+            active_criteria_count=active_criteria_count,
+            excluded=True,
+            matched_title=False,
+            matched_profile=False,
+            matched_industry=False,
+            matched_title_terms=[],
+            matched_profile_terms=[],
+            matched_industry_terms=[],
+            matched_exclusion_terms=matched_exclusion_terms,
+        )
+
+    matched_title_terms = _matched_terms(profile.title_keywords, text_lemmas) if active_title else []
+    matched_profile_terms = _matched_terms(profile.profile_keywords, text_lemmas) if active_profile else []
+    matched_industry_terms = _matched_terms(profile.industry_keywords, text_lemmas) if active_industry else []
 
     matched_title = active_title and bool(matched_title_terms)
     matched_profile = active_profile and bool(matched_profile_terms)
     matched_industry = active_industry and bool(matched_industry_terms)
 
     score = int(matched_title) + int(matched_profile) + int(matched_industry)
-    active_criteria_count = int(active_title) + int(active_profile) + int(active_industry)
     excluded = bool(matched_exclusion_terms)
 
     return MatchResult(
@@ -79,42 +97,89 @@ def evaluate_message(text: str, profile: JobProfileSettings) -> MatchResult:
     )
 
 
-def _matched_terms(terms: list[str], text_lemmas: set[str]) -> list[str]:
-    matched: list[str] = []
-    for term in terms:
-        term_lemmas = extract_lemmas(term)
-        if not term_lemmas:
-            continue
-        if all(lemma in text_lemmas for lemma in term_lemmas):
-            matched.append(term)
-    return matched
+def prepare_profile(profile: JobProfileSettings) -> None:
+    # Builds the keyword indexes up front so the first scanned message does not pay for them.
+    for terms in (
+        profile.title_keywords,
+        profile.profile_keywords,
+        profile.industry_keywords,
+        profile.exclusion_phrases,
+    ):
+        if terms:
+            _term_index(tuple(terms))
 
 
-def _dedupe_terms(terms: list[str]) -> list[str]:
-    unique_terms: list[str] = []
-    seen: set[str] = set()
-    for term in terms:
-        key = term.strip().lower()
-        if not key or key in seen:
-            continue
-        seen.add(key)
-        unique_terms.append(term)
-    return unique_terms
+def _matched_terms(terms: list[str], text_lemmas: frozenset[str]) -> list[str]:
+    if not terms:
+        return []
+    return _matched_indexed_terms(terms, _term_index(tuple(terms)), text_lemmas)
 
 
-def extract_lemmas(text: str) -> list[str]:
-    tokens = [token.lower() for token in _WORD_RE.findall(text)]
-    if not tokens:
-        return []
+def _matched_system_terms(text_lemmas: frozenset[str]) -> list[str]:
+    return _matched_indexed_terms(_SYSTEM_EXCLUSION_PHRASES, _SYSTEM_EXCLUSION_INDEX, text_lemmas)
+
+
+def _matched_indexed_terms(
+    terms: list[str] | tuple[str, ...],
+    index: tuple[dict[str, tuple[int, ...]], tuple[int, ...]],
+    text_lemmas: frozenset[str],
+) -> list[str]:
+    postings, needed = index
+    hits = [0] * len(needed)
+    for lemma in postings.keys() & text_lemmas:
+        for position in postings[lemma]:
+            hits[position] += 1
+    return [term for term, hit, need in zip(terms, hits, needed) if need and hit == need]
+
 
-    lemmas: list[str] = []
-    for token in tokens:
-        if _MORPH is None:
-            lemmas.append(token)
-            continue
-        parsed = _MORPH.parse(token)
-        if parsed:
-            lemmas.append(parsed[0].normal_form)
-        else:
-            lemmas.append(token)
-    return lemmas
+def _dedupe_terms(terms: list[str]) -> list[str]:
+    if len(terms) < 2:
+        return [term for term in terms if term.strip()]
+    unique_terms: dict[str, str] = {}
+    for term in terms:
+        key = term.strip().lower()
+        if key and key not in unique_terms:
+            unique_terms[key] = term
+    return list(unique_terms.values())
+
+
+def extract_lemmas(text: str, max_tokens: int | None = None) -> list[str]:
+    if max_tokens is None:
+        return list(map(_lemma_of, _WORD_RE.findall(text)))
+    # Long forwards are cut off here: the matching signal saturates well before the tail.
+    return [_lemma_of(match.group()) for match in itertools.islice(_WORD_RE.finditer(text), max_tokens)]
+
+
+@functools.lru_cache(maxsize=200_000)
+def _lemma_of(token: str) -> str:
+    # Keyed by the raw token so cache hits skip the lower() allocation too.
+    lowered = token.lower()
+    # pymorphy3 only inflects Cyrillic; ASCII words and numbers are their own normal form.
+    if _MORPH is None or lowered.isascii():
+        return sys.intern(lowered)
+    parsed = _MORPH.parse(lowered)
+    if parsed:
+        # Interned so index lookups against text lemmas compare by identity first.
+        return sys.intern(parsed[0].normal_form)
+    return sys.intern(lowered)
+
+
+@functools.lru_cache(maxsize=8192)
+def _lemmatize_term(term: str) -> tuple[str, ...]:
+    return tuple(extract_lemmas(term))
+
+
+@functools.lru_cache(maxsize=256)
+def _term_index(terms: tuple[str, ...]) -> tuple[dict[str, tuple[int, ...]], tuple[int, ...]]:
+    # Inverted index lemma -> term positions, plus how many distinct lemmas each term needs.
+    postings: dict[str, list[int]] = {}
+    needed: list[int] = []
+    for position, term in enumerate(terms):
+        lemmas = set(_lemmatize_term(term))
+        needed.append(len(lemmas))
+        for lemma in lemmas:
+            postings.setdefault(lemma, []).append(position)
+    return {lemma: tuple(positions) for lemma, positions in postings.items()}, tuple(needed)
+
+
+_SYSTEM_EXCLUSION_INDEX = _term_index(_SYSTEM_EXCLUSION_PHRASES)
@@ -1,23 +1,27 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
 import re
+import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Callable
+from typing import Any, Callable
 
 from telethon import TelegramClient
 from telethon.errors import SessionPasswordNeededError
 
 from tjr.core.input_parser import parse_chat_sources_list
-from tjr.core.matching import MatchResult, evaluate_message
+from tjr.core.matching import MatchResult, evaluate_message, prepare_profile
 from tjr.storage.app_paths import session_path
 from tjr.storage.config_store import AppConfig
 
 logger = logging.getLogger(__name__)
 _FIXED_MIN_MATCH_SCORE = 1
+_CONCURRENT_SOURCES = 4
+_PROGRESS_INTERVAL_SECONDS = 0.1
 
 
 @dataclass(slots=True)
@@ -45,7 +49,7 @@ class ScanReport:
     canceled: bool = False
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class ParsedSource:
     raw_source: str
     chat_ref: str | int
@@ -69,8 +73,8 @@ class ScanProgress:
     matched_count: int
     latest_match: MatchRecord | None = None
 
-_MESSAGE_LINK_RE = re.compile(r"^https?://t\.me/(?P<chat>[^/]+)/(?P<msg_id>\d+)/?$", re.IGNORECASE)
-_PRIVATE_LINK_RE = re.compile(r"^https?://t\.me/c/(?P<chat_id>\d+)/(?P<msg_id>\d+)/?$", re.IGNORECASE)
+# Matched against lowered input, so no IGNORECASE; Telegram usernames are case-insensitive.
+_MESSAGE_LINK_RE = re.compile(r"https?://t\.me/(?:c/(?P<chat_id>\d+)|(?P<chat>[^/]+))/(?P<msg_id>\d+)/?")
 
 
 def run_scan(
@@ -99,12 +103,10 @@ def run_scan(
 
 def _telegram_credentials_state(config: AppConfig) -> str:
     tg = config.telegram
-    values = [tg.api_id.strip(), tg.api_hash.strip(), tg.phone_number.strip()]
-    if all(values):
+    filled = (bool(tg.api_id.strip()), bool(tg.api_hash.strip()), bool(tg.phone_number.strip()))
+    if all(filled):
         return "complete"
-    if any(values):
-        return "partial"
-    return "empty"
+    return "partial" if any(filled) else "empty"
 
 
 async def _run_real_scan(
@@ -126,7 +128,7 @@ async def _run_real_scan(
     )
     logger.info("Date depth setup | days=%s | cutoff=%s", config.scan_depth_days, cutoff_dt.isoformat())
     sources = [_parse_source(source) for source in expanded_sources]
-    banned_links = {link.strip().lower() for link in config.banned_message_links if link.strip()}
+    banned_links = _banned_link_set(config.banned_message_links)
     session_path = _session_path()
     session_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -137,7 +139,10 @@ async def _run_real_scan(
     scanned_chats = 0
     scanned_messages = 0
     matches: list[MatchRecord] = []
+    seen_keys: set[str] = set()
+    removed_duplicates = 0
     canceled = False
+    progress_due = _progress_rate_limiter()
     active_criteria_count = _active_criteria_count(config)
     effective_threshold = _effective_threshold(_FIXED_MIN_MATCH_SCORE, active_criteria_count)
     logger.info(
@@ -147,9 +152,11 @@ async def _run_real_scan(
         effective_threshold,
         max(1, active_criteria_count),
     )
+    prepare_profile(config.job_profile)
 
     client = TelegramClient(str(session_path), api_id, api_hash)
     await client.connect()
+    fetches: list[asyncio.Task | None] = []
 
     try:
         await _ensure_authorized(
@@ -159,25 +166,42 @@ async def _run_real_scan(
             request_password=request_password,
         )
 
+        # Resolve and fetch chats ahead concurrently; results are processed strictly in source order.
+        semaphore = asyncio.Semaphore(_CONCURRENT_SOURCES)
+        resolved = await asyncio.gather(
+            *(_resolve_source_entity(client, source, semaphore, should_stop) for source in sources)
+        )
+        cutoff_ts = cutoff_dt.timestamp()
         total_chats = len(sources)
-        for source_index, source in enumerate(sources, start=1):
+        fetches = [None] * total_chats
+        scheduled = 0
+
+        for source_index, (source, (entity, display_name)) in enumerate(zip(sources, resolved), start=1):
             if _is_stop_requested(should_stop):
                 canceled = True
                 break
+            # Fetches run at most _CONCURRENT_SOURCES chats ahead, so only that many chats are buffered.
+            window_end = min(total_chats, source_index - 1 + _CONCURRENT_SOURCES)
+            while scheduled < window_end:
+                ahead_source = sources[scheduled]
+                ahead_entity = resolved[scheduled][0]
+                if ahead_entity is not None:
+                    fetches[scheduled] = asyncio.create_task(
+                        _fetch_messages(client, ahead_entity, ahead_source, cutoff_ts, should_stop, semaphore)
+                    )
+                scheduled += 1
+            fetch = fetches[source_index - 1]
             _emit_progress(
                 progress_callback,
-                ScanProgress(
-                    phase="chat_start",
-                    current_chat=source.raw_source,
-                    current_chat_index=source_index,
-                    completed_chats=scanned_chats,
-                    total_chats=total_chats,
-                    scanned_messages=scanned_messages,
-                    matched_count=len(matches),
-                ),
+                phase="chat_start",
+                current_chat=source.raw_source,
+                current_chat_index=source_index,
+                completed_chats=scanned_chats,
+                total_chats=total_chats,
+                scanned_messages=scanned_messages,
+                matched_count=len(matches),
             )
-            entity, display_name = await _resolve_source_entity(client, source)
-            if entity is None:
+            if entity is None or fetch is None:
                 logger.warning("Source resolve failed via Telegram API: %s", source.raw_source)
                 continue
 
@@ -185,23 +209,23 @@ async def _run_real_scan(
             logger.info("Scanning chat: %s", display_name)
             _emit_progress(
                 progress_callback,
-                ScanProgress(
-                    phase="chat_resolved",
-                    current_chat=display_name,
-                    current_chat_index=source_index,
-                    completed_chats=scanned_chats - 1,
-                    total_chats=total_chats,
-                    scanned_messages=scanned_messages,
-                    matched_count=len(matches),
-                ),
+                phase="chat_resolved",
+                current_chat=display_name,
+                current_chat_index=source_index,
+                completed_chats=scanned_chats - 1,
+                total_chats=total_chats,
+                scanned_messages=scanned_messages,
+                matched_count=len(matches),
             )
 
-            try:
-                messages = await _load_messages_for_source(client, entity, source, cutoff_dt, should_stop)
-            except Exception as exc:  # noqa: BLE001
-                logger.warning("Source read failed via Telegram API: %s | %s", source.raw_source, exc)
+            messages, read_error = await fetch
+            # Drop the finished task so its messages are freed once this chat is processed.
+            fetches[source_index - 1] = None
+            if read_error is not None:
+                logger.warning("Source read failed via Telegram API: %s | %s", source.raw_source, read_error)
                 continue
 
+            link_prefix = _message_link_prefix(entity)
             for msg in messages:
                 if _is_stop_requested(should_stop):
                     canceled = True
@@ -214,26 +238,40 @@ async def _run_real_scan(
                     continue
 
                 scanned_messages += 1
-                published_at = msg.date.replace(tzinfo=None) if msg.date else datetime.now()
-                link = _build_message_link(entity, msg.id)
-                if link and link.lower() in banned_links:
+                link = f"{link_prefix}{msg.id}" if link_prefix else ""
+                link_key = link.lower()
+                if link_key in banned_links:
                     logger.info("Message skipped by ban list | chat=%s | link=%s", display_name, link)
                     continue
 
-                match_record = _evaluate_candidate_message(
+                match = _evaluate_candidate_message(
                     channel=display_name,
-                    published_at=published_at,
+                    published_at=msg.date,
                     text=text,
                     link=link,
                     config=config,
                     active_criteria_count=active_criteria_count,
                     effective_threshold=effective_threshold,
                 )
-                if match_record is not None:
-                    matches.append(match_record)
-                    _emit_progress(
-                        progress_callback,
-                        ScanProgress(
+                if match is not None:
+                    # The naive datetime is only needed for kept matches.
+                    published_at = _naive_datetime(msg.date)
+                    key = _match_record_key(link_key, display_name, published_at, text)
+                    if key in seen_keys:
+                        removed_duplicates += 1
+                    else:
+                        seen_keys.add(key)
+                        # Records are only built for matches that survive dedupe.
+                        match_record = MatchRecord(
+                            channel=display_name,
+                            published_at=published_at,
+                            text=text,
+                            link=link,
+                            match_result=match,
+                        )
+                        matches.append(match_record)
+                        _emit_progress(
+                            progress_callback,
                             phase="match_found",
                             current_chat=display_name,
                             current_chat_index=source_index,
@@ -242,49 +280,46 @@ async def _run_real_scan(
                             scanned_messages=scanned_messages,
                             matched_count=len(matches),
                             latest_match=match_record,
-                        ),
-                    )
+                        )
 
-                if scanned_messages % 20 == 0:
+                if scanned_messages % 20 == 0 and progress_due():
                     _emit_progress(
                         progress_callback,
-                        ScanProgress(
-                            phase="message_progress",
-                            current_chat=display_name,
-                            current_chat_index=source_index,
-                            completed_chats=scanned_chats - 1,
-                            total_chats=total_chats,
-                            scanned_messages=scanned_messages,
-                            matched_count=len(matches),
-                        ),
+                        phase="message_progress",
+                        current_chat=display_name,
+                        current_chat_index=source_index,
+                        completed_chats=scanned_chats - 1,
+                        total_chats=total_chats,
+                        scanned_messages=scanned_messages,
+                        matched_count=len(matches),
                     )
 
             _emit_progress(
                 progress_callback,
-                ScanProgress(
-                    phase="chat_done",
-                    current_chat=display_name,
-                    current_chat_index=source_index,
-                    completed_chats=scanned_chats,
-                    total_chats=total_chats,
-                    scanned_messages=scanned_messages,
-                    matched_count=len(matches),
-                ),
+                phase="chat_done",
+                current_chat=display_name,
+                current_chat_index=source_index,
+                completed_chats=scanned_chats,
+                total_chats=total_chats,
+                scanned_messages=scanned_messages,
+                matched_count=len(matches),
             )
             if canceled:
                 break
     finally:
+        pending = [fetch for fetch in fetches if fetch is not None]
+        for fetch in pending:
+            fetch.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
         await client.disconnect()
 
-    deduped_matches = _dedupe_match_records(matches)
-    removed_duplicates = len(matches) - len(deduped_matches)
     if removed_duplicates > 0:
         logger.info("Deduplicated matches | removed=%s", removed_duplicates)
 
     return ScanReport(
         scanned_chats=scanned_chats,
         scanned_messages=scanned_messages,
-        matched_records=deduped_matches,
+        matched_records=matches,
         canceled=canceled,
     )
 
@@ -326,9 +361,34 @@ async def _ensure_authorized(
     logger.info("Telegram authorization completed with 2FA password")
 
 
-async def _resolve_source_entity(client: TelegramClient, source: ParsedSource):
+async def _fetch_messages(
+    client: TelegramClient,
+    entity,
+    source: ParsedSource,
+    cutoff_ts: float,
+    should_stop: StopCheck | None,
+    semaphore: asyncio.Semaphore,
+):
+    async with semaphore:
+        try:
+            messages = await _load_messages_for_source(client, entity, source, cutoff_ts, should_stop)
+        except Exception as exc:  # noqa: BLE001
+            return [], exc
+        return messages, None
+
+
+async def _resolve_source_entity(
+    client: TelegramClient,
+    source: ParsedSource,
+    semaphore: asyncio.Semaphore,
+    should_stop: StopCheck | None = None,
+):
     try:
-        entity = await client.get_entity(source.chat_ref)
+        async with semaphore:
+            # Sources still waiting for the semaphore are skipped once a stop is requested.
+            if _is_stop_requested(should_stop):
+                return None, source.raw_source
+            entity = await client.get_entity(source.chat_ref)
     except Exception as exc:  # noqa: BLE001
         logger.warning("Cannot resolve source '%s': %s", source.raw_source, exc)
         return None, source.raw_source
@@ -341,14 +401,16 @@ async def _load_messages_for_source(
     client: TelegramClient,
     entity,
     source: ParsedSource,
-    cutoff_dt: datetime,
+    cutoff_ts: float,
     should_stop: StopCheck | None,
 ):
+    # Telegram dates are aware UTC datetimes, so comparing POSIX timestamps needs no
+    # naive copy per message.
     if source.message_id is not None:
         message = await client.get_messages(entity, ids=source.message_id)
         if message is None:
             return []
-        if message.date and message.date.replace(tzinfo=None) < cutoff_dt:
+        if message.date and message.date.timestamp() < cutoff_ts:
             return []
         return [message]
 
@@ -358,21 +420,20 @@ async def _load_messages_for_source(
             break
         if message is None:
             continue
-        message_dt = message.date.replace(tzinfo=None) if message.date else datetime.now()
-        if message_dt < cutoff_dt:
+        if message.date and message.date.timestamp() < cutoff_ts:
             break
         loaded.append(message)
     return loaded
 
 
-def _build_message_link(entity, message_id: int) -> str:
+def _message_link_prefix(entity) -> str:
     username = getattr(entity, "username", None)
     if username:
-        return f"https://t.me/{username}/{message_id}"
+        return f"https://t.me/{username}/"
 
     raw_id = getattr(entity, "id", None)
     if isinstance(raw_id, int):
-        return f"https://t.me/c/{raw_id}/{message_id}"
+        return f"https://t.me/c/{raw_id}/"
     return ""
 
 
@@ -380,20 +441,16 @@ def _session_path() -> Path:
     return session_path()
 
 
+@functools.lru_cache(maxsize=4096)
 def _parse_source(source: str) -> ParsedSource:
     value = source.strip()
 
-    private_match = _PRIVATE_LINK_RE.match(value)
-    if private_match:
-        internal_id = private_match.group("chat_id")
-        message_id = int(private_match.group("msg_id"))
-        return ParsedSource(raw_source=value, chat_ref=int(f"-100{internal_id}"), message_id=message_id)
-
-    public_match = _MESSAGE_LINK_RE.match(value)
-    if public_match:
-        chat_ref = public_match.group("chat")
-        message_id = int(public_match.group("msg_id"))
-        return ParsedSource(raw_source=value, chat_ref=chat_ref, message_id=message_id)
+    message_match = _MESSAGE_LINK_RE.fullmatch(value.lower())
+    if message_match:
+        internal_id, chat_ref, msg_id = message_match.group("chat_id", "chat", "msg_id")
+        if internal_id is not None:
+            return ParsedSource(raw_source=value, chat_ref=int(f"-100{internal_id}"), message_id=int(msg_id))
+        return ParsedSource(raw_source=value, chat_ref=chat_ref, message_id=int(msg_id))
 
     if value.startswith("https://t.me/"):
         tail = value.removeprefix("https://t.me/").strip("/")
@@ -405,38 +462,41 @@ def _parse_source(source: str) -> ParsedSource:
 def _evaluate_candidate_message(
     *,
     channel: str,
-    published_at: datetime,
+    published_at: datetime | None,
     text: str,
     link: str,
     config: AppConfig,
     active_criteria_count: int,
     effective_threshold: int,
-) -> MatchRecord | None:
-    logger.info(
-        "Scanning message | chat=%s | date=%s | link=%s | text=%s",
-        channel,
-        published_at.isoformat(),
-        link,
-        _shorten(text),
-    )
-
-    match = evaluate_message(text, config.job_profile)
-    if match.excluded:
+) -> MatchResult | None:
+    if logger.isEnabledFor(logging.INFO):
         logger.info(
-            "Message excluded | chat=%s | by=%s",
+            "Scanning message | chat=%s | date=%s | link=%s | text=%s",
             channel,
-            ", ".join(match.matched_exclusion_terms),
+            _naive_datetime(published_at).isoformat(),
+            link,
+            _shorten(text),
         )
+
+    match = evaluate_message(text, config.job_profile, fast_exclude=True)
+    if match.excluded:
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Message excluded | chat=%s | by=%s",
+                channel,
+                ", ".join(match.matched_exclusion_terms),
+            )
         return None
 
-    logger.info(
-        "Match metrics | chat=%s | score=%s/%s | threshold=%s/%s",
-        channel,
-        match.score,
-        max(1, active_criteria_count),
-        effective_threshold,
-        max(1, active_criteria_count),
-    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Match metrics | chat=%s | score=%s/%s | threshold=%s/%s",
+            channel,
+            match.score,
+            max(1, active_criteria_count),
+            effective_threshold,
+            max(1, active_criteria_count),
+        )
     if match.score < effective_threshold:
         return None
 
@@ -448,13 +508,7 @@ def _evaluate_candidate_message(
         ", ".join(match.matched_profile_terms) or "-",
         ", ".join(match.matched_industry_terms) or "-",
     )
-    return MatchRecord(
-        channel=channel,
-        published_at=published_at,
-        text=text,
-        link=link,
-        match_result=match,
-    )
+    return match
 
 
 def _run_demo_scan(
@@ -474,12 +528,15 @@ def _run_demo_scan(
     )
     logger.info("Date depth setup | days=%s | cutoff=%s", config.scan_depth_days, cutoff_dt.isoformat())
     messages = _build_demo_messages(expanded_sources)
-    banned_links = {link.strip().lower() for link in config.banned_message_links if link.strip()}
+    banned_links = _banned_link_set(config.banned_message_links)
 
     scanned_chats = 0
     scanned_messages = 0
     matches: list[MatchRecord] = []
+    seen_keys: set[str] = set()
+    removed_duplicates = 0
     canceled = False
+    progress_due = _progress_rate_limiter()
     active_criteria_count = _active_criteria_count(config)
     effective_threshold = _effective_threshold(_FIXED_MIN_MATCH_SCORE, active_criteria_count)
     logger.info(
@@ -489,6 +546,7 @@ def _run_demo_scan(
         effective_threshold,
         max(1, active_criteria_count),
     )
+    prepare_profile(config.job_profile)
 
     total_chats = len(messages)
     for chat_index, (chat_name, chat_messages) in enumerate(messages.items(), start=1):
@@ -498,15 +556,13 @@ def _run_demo_scan(
         scanned_chats += 1
         _emit_progress(
             progress_callback,
-            ScanProgress(
-                phase="chat_start",
-                current_chat=chat_name,
-                current_chat_index=chat_index,
-                completed_chats=chat_index - 1,
-                total_chats=total_chats,
-                scanned_messages=scanned_messages,
-                matched_count=len(matches),
-            ),
+            phase="chat_start",
+            current_chat=chat_name,
+            current_chat_index=chat_index,
+            completed_chats=chat_index - 1,
+            total_chats=total_chats,
+            scanned_messages=scanned_messages,
+            matched_count=len(matches),
         )
         logger.info("Scanning chat: %s", chat_name)
         for message in chat_messages:
@@ -516,56 +572,64 @@ def _run_demo_scan(
             if message.published_at < cutoff_dt:
                 continue
 
-            if message.link and message.link.lower() in banned_links:
+            link_key = message.link.lower()
+            if link_key in banned_links:
                 logger.info("Message skipped by ban list | chat=%s | link=%s", chat_name, message.link)
                 continue
 
             scanned_messages += 1
-            logger.info(
-                "Scanning message | chat=%s | date=%s | link=%s | text=%s",
-                chat_name,
-                message.published_at.isoformat(),
-                message.link,
-                _shorten(message.text),
-            )
-
-            match = evaluate_message(message.text, config.job_profile)
-            if match.excluded:
+            if logger.isEnabledFor(logging.INFO):
                 logger.info(
-                    "Message excluded | chat=%s | by=%s",
+                    "Scanning message | chat=%s | date=%s | link=%s | text=%s",
                     chat_name,
-                    ", ".join(match.matched_exclusion_terms),
+                    message.published_at.isoformat(),
+                    message.link,
+                    _shorten(message.text),
                 )
+
+            match = evaluate_message(message.text, config.job_profile, fast_exclude=True)
+            if match.excluded:
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "Message excluded | chat=%s | by=%s",
+                        chat_name,
+                        ", ".join(match.matched_exclusion_terms),
+                    )
                 continue
-            logger.info(
-                "Match metrics | chat=%s | score=%s/%s | threshold=%s/%s",
-                chat_name,
-                match.score,
-                max(1, active_criteria_count),
-                effective_threshold,
-                max(1, active_criteria_count),
-            )
-            if match.score >= effective_threshold:
+            if logger.isEnabledFor(logging.INFO):
                 logger.info(
-                    "Match found | chat=%s | score=%s | title=%s | profile=%s | industry=%s",
+                    "Match metrics | chat=%s | score=%s/%s | threshold=%s/%s",
                     chat_name,
                     match.score,
-                    ", ".join(match.matched_title_terms) or "-",
-                    ", ".join(match.matched_profile_terms) or "-",
-                    ", ".join(match.matched_industry_terms) or "-",
+                    max(1, active_criteria_count),
+                    effective_threshold,
+                    max(1, active_criteria_count),
                 )
-                matches.append(
-                    MatchRecord(
-                        channel=chat_name,
-                        published_at=message.published_at,
-                        text=message.text,
-                        link=message.link,
-                        match_result=match,
+            if match.score >= effective_threshold:
+                key = _match_record_key(link_key, chat_name, message.published_at, message.text)
+                if key in seen_keys:
+                    removed_duplicates += 1
+                else:
+                    seen_keys.add(key)
+                    logger.info(
+                        "Match found | chat=%s | score=%s | title=%s | profile=%s | industry=%s",
+                        chat_name,
+                        match.score,
+                        ", ".join(match.matched_title_terms) or "-",
+                        ", ".join(match.matched_profile_terms) or "-",
+                        ", ".join(match.matched_industry_terms) or "-",
                     )
-                )
-                _emit_progress(
-                    progress_callback,
-                    ScanProgress(
+                    matches.append(
+                        MatchRecord(
+                            channel=chat_name,
+                            published_at=message.published_at,
+                            text=message.text,
+                            link=message.link,
+                            match_result=match,
+                        )
+                    )
+                    _emit_progress(
+                        progress_callback,
                         phase="match_found",
                         current_chat=chat_name,
                         current_chat_index=chat_index,
@@ -574,47 +638,40 @@ def _run_demo_scan(
                         scanned_messages=scanned_messages,
                         matched_count=len(matches),
                         latest_match=matches[-1],
-                    ),
-                )
+                    )
 
-            if scanned_messages % 5 == 0:
+            if scanned_messages % 5 == 0 and progress_due():
                 _emit_progress(
                     progress_callback,
-                    ScanProgress(
-                        phase="message_progress",
-                        current_chat=chat_name,
-                        current_chat_index=chat_index,
-                        completed_chats=chat_index - 1,
-                        total_chats=total_chats,
-                        scanned_messages=scanned_messages,
-                        matched_count=len(matches),
-                    ),
+                    phase="message_progress",
+                    current_chat=chat_name,
+                    current_chat_index=chat_index,
+                    completed_chats=chat_index - 1,
+                    total_chats=total_chats,
+                    scanned_messages=scanned_messages,
+                    matched_count=len(matches),
                 )
 
         _emit_progress(
             progress_callback,
-            ScanProgress(
-                phase="chat_done",
-                current_chat=chat_name,
-                current_chat_index=chat_index,
-                completed_chats=chat_index,
-                total_chats=total_chats,
-                scanned_messages=scanned_messages,
-                matched_count=len(matches),
-            ),
+            phase="chat_done",
+            current_chat=chat_name,
+            current_chat_index=chat_index,
+            completed_chats=chat_index,
+            total_chats=total_chats,
+            scanned_messages=scanned_messages,
+            matched_count=len(matches),
         )
         if canceled:
             break
 
-    deduped_matches = _dedupe_match_records(matches)
-    removed_duplicates = len(matches) - len(deduped_matches)
     if removed_duplicates > 0:
         logger.info("Deduplicated matches | removed=%s", removed_duplicates)
 
     return ScanReport(
         scanned_chats=scanned_chats,
         scanned_messages=scanned_messages,
-        matched_records=deduped_matches,
+        matched_records=matches,
         canceled=canceled,
     )
 
@@ -651,12 +708,17 @@ def _build_demo_messages(chats: list[str]) -> dict[str, list[ChatMessage]]:
     return data
 
 
+@functools.lru_cache(maxsize=4096)
 def _normalize_chat_link(chat: str) -> str:
     if chat.startswith("http://") or chat.startswith("https://"):
         return chat.rstrip("/")
     return f"https://t.me/{chat.lstrip('@').rstrip('/')}"
 
 
+def _naive_datetime(value: datetime | None) -> datetime:
+    return value.replace(tzinfo=None) if value else datetime.now()
+
+
 def _shorten(text: str, limit: int = 180) -> str:
     if len(text) <= limit:
         return text
@@ -679,25 +741,16 @@ def _effective_threshold(configured_threshold: int, active_criteria_count: int)
     return max(1, min(configured_threshold, active_criteria_count))
 
 
-def _dedupe_match_records(records: list[MatchRecord]) -> list[MatchRecord]:
-    unique: list[MatchRecord] = []
-    seen: set[str] = set()
-    for record in records:
-        key = _match_record_key(record)
-        if key in seen:
-            continue
-        seen.add(key)
-        unique.append(record)
-    return unique
+def _banned_link_set(links: list[str]) -> frozenset[str]:
+    # Empty links are dropped so a message without a link never hits the ban list.
+    return frozenset(stripped.lower() for link in links if (stripped := link.strip()))
 
 
-def _match_record_key(record: MatchRecord) -> str:
-    link = record.link.strip().lower()
-    if link:
-        return f"link:{link}"
-    channel = record.channel.strip().lower()
-    text = record.text.strip().lower()
-    return f"text:{channel}|{record.published_at.isoformat()}|{text}"
+def _match_record_key(link_key: str, channel: str, published_at: datetime, text: str) -> str:
+    # link_key is the already lowered message link used for the ban check.
+    if link_key:
+        return f"link:{link_key}"
+    return f"text:{channel.strip().lower()}|{published_at.isoformat()}|{text.strip().lower()}"
 
 
 def _is_stop_requested(should_stop: StopCheck | None) -> bool:
@@ -710,10 +763,27 @@ def _is_stop_requested(should_stop: StopCheck | None) -> bool:
         return False
 
 
-def _emit_progress(progress_callback: ProgressCallback | None, progress: ScanProgress) -> None:
+def _progress_rate_limiter() -> Callable[[], bool]:
+    # Gates the periodic message_progress ticks before their ScanProgress is built;
+    # chat and match events are always emitted.
+    last_emit = float("-inf")
+
+    def due() -> bool:
+        nonlocal last_emit
+        now = time.monotonic()
+        if now - last_emit < _PROGRESS_INTERVAL_SECONDS:
+            return False
+        last_emit = now
+        return True
+
+    return due
+
+
+def _emit_progress(progress_callback: ProgressCallback | None, **fields: Any) -> None:
+    # ScanProgress is only built when someone is listening.
     if progress_callback is None:
         return
     try:
-        progress_callback(progress)
+        progress_callback(ScanProgress(**fields))
     except Exception:  # noqa: BLE001
         logger.exception("Progress callback failed")
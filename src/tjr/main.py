@@ -3,7 +3,7 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 
-from PySide6.QtGui import QIcon
+from PySide6.QtGui import QIcon, QPixmapCache
 from PySide6.QtWidgets import QApplication
 
 from tjr.core.logging_setup import configure_logging
@@ -29,6 +29,8 @@ def run() -> int:
     configure_logging()
     app = QApplication(sys.argv)
     app.setApplicationName("TJR")
+    # Room for the decoded hero art (KiB); the 10 MiB default is shared with Qt's own styles.
+    QPixmapCache.setCacheLimit(20480)
     icon_path = _resolve_icon_path()
     if icon_path is not None:
         app.setWindowIcon(QIcon(str(icon_path)))
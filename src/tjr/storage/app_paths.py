@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import os
 import platform
 from pathlib import Path
@@ -7,6 +8,7 @@ from pathlib import Path
 APP_NAME = "TJR"
 
 
+@functools.lru_cache(maxsize=1)
 def app_data_dir() -> Path:
     system = platform.system()
     if system == "Darwin":
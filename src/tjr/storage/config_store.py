@@ -1,12 +1,20 @@
 from __future__ import annotations
 
 import json
-from dataclasses import asdict, dataclass, field
+import mmap
+import os
+import sys
+from dataclasses import asdict, dataclass, field, replace
 from pathlib import Path
 from typing import Any
 
 from tjr.storage.app_paths import config_path as default_config_path
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 
 @dataclass(slots=True)
 class TelegramSettings:
@@ -14,6 +22,9 @@ class TelegramSettings:
     api_hash: str = ""
     phone_number: str = ""
 
+    def copy(self) -> TelegramSettings:
+        return replace(self)
+
 
 @dataclass(slots=True)
 class JobProfileSettings:
@@ -22,6 +33,16 @@ class JobProfileSettings:
     industry_keywords: list[str] = field(default_factory=list)
     exclusion_phrases: list[str] = field(default_factory=list)
     min_match_score: int = 2
+    max_message_tokens: int = 2000
+
+    def copy(self) -> JobProfileSettings:
+        return replace(
+            self,
+            title_keywords=list(self.title_keywords),
+            profile_keywords=list(self.profile_keywords),
+            industry_keywords=list(self.industry_keywords),
+            exclusion_phrases=list(self.exclusion_phrases),
+        )
 
 
 @dataclass(slots=True)
@@ -32,34 +53,140 @@ class AppConfig:
     scan_depth_days: int = 14
     banned_message_links: list[str] = field(default_factory=list)
 
+    def copy(self) -> AppConfig:
+        # Field-wise copy of the fixed config shape; much cheaper than copy.deepcopy.
+        return replace(
+            self,
+            telegram=self.telegram.copy(),
+            selected_chats=list(self.selected_chats),
+            job_profile=self.job_profile.copy(),
+            banned_message_links=list(self.banned_message_links),
+        )
+
+
+_KEYWORD_FIELDS = ("title_keywords", "profile_keywords", "industry_keywords", "exclusion_phrases")
+
+# Written verbatim on first run; same layout as the stdlib save path.
+_DEFAULT_CONFIG_BYTES = json.dumps(asdict(AppConfig()), ensure_ascii=False, indent=2).encode("utf-8")
+
 
 class ConfigStore:
     def __init__(self, config_path: Path | None = None) -> None:
         self._config_path = config_path or default_config_path()
+        # (st_mtime_ns, st_size) of the file the cached config was read from or written to.
+        self._cache: tuple[tuple[int, int], AppConfig] | None = None
+        self._parent_ready = False
 
     def load(self) -> AppConfig:
-        if not self._config_path.exists():
+        try:
+            stat = self._config_path.stat()
+        except OSError:
             return AppConfig()
 
+        key = (stat.st_mtime_ns, stat.st_size)
+        if self._cache is not None and self._cache[0] == key:
+            # Callers mutate the returned config, so never hand out the cached instance.
+            return self._cache[1].copy()
+
         try:
-            raw = json.loads(self._config_path.read_text(encoding="utf-8"))
-            return self._from_dict(raw)
+            if orjson is not None and stat.st_size >= mmap.PAGESIZE:
+                raw = self._load_mapped()
+            else:
+                # Both parsers take UTF-8 bytes directly; no intermediate str decode.
+                data = self._config_path.read_bytes()
+                raw = orjson.loads(data) if orjson is not None else json.loads(data)
+            config = self._from_dict(raw)
         except (json.JSONDecodeError, OSError, ValueError):
             return AppConfig()
 
+        self._cache = (key, config)
+        return config.copy()
+
+    def _load_mapped(self) -> Any:
+        # orjson parses straight from the page cache; small files are cheaper via read_bytes.
+        with open(self._config_path, "rb") as file:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+                return orjson.loads(view)
+
     def save(self, config: AppConfig) -> None:
-        self._config_path.parent.mkdir(parents=True, exist_ok=True)
-        payload = asdict(config)
-        self._config_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+        if not self._parent_ready:
+            self._config_path.parent.mkdir(parents=True, exist_ok=True)
+            self._parent_ready = True
+        payload = self._to_dict(config)
+        if orjson is not None:
+            data = orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8")
+        stat = self._write_atomic(data)
+        # Normalize the payload we just wrote instead of re-reading it on the next load.
+        self._cache = ((stat.st_mtime_ns, stat.st_size), self._from_dict(payload))
 
     def ensure_exists(self) -> None:
-        if self._config_path.exists():
+        try:
+            os.stat(self._config_path)
+        except FileNotFoundError:
+            self._write_defaults()
+        # The file exists now, so later saves can skip creating its directory.
+        self._parent_ready = True
+
+    def _write_defaults(self) -> None:
+        self._config_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            fd = os.open(self._config_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        except FileExistsError:
             return
-        self.save(AppConfig())
+        try:
+            os.write(fd, _DEFAULT_CONFIG_BYTES)
+            stat = os.fstat(fd)
+        finally:
+            os.close(fd)
+        self._cache = ((stat.st_mtime_ns, stat.st_size), AppConfig())
+
+    def _write_atomic(self, data: bytes) -> os.stat_result:
+        # Write a sibling temp file and rename it over the config so a crash never leaves it truncated.
+        tmp_path = self._config_path.with_name(self._config_path.name + ".tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view) :]
+            os.fsync(fd)
+            stat = os.fstat(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, self._config_path)
+        return stat
+
+    @staticmethod
+    def _to_dict(config: AppConfig) -> dict[str, Any]:
+        # Flat, non-recursive replacement for dataclasses.asdict; lists are serialized, not copied.
+        telegram = config.telegram
+        profile = config.job_profile
+        return {
+            "telegram": {
+                "api_id": telegram.api_id,
+                "api_hash": telegram.api_hash,
+                "phone_number": telegram.phone_number,
+            },
+            "selected_chats": config.selected_chats,
+            "job_profile": {
+                "title_keywords": profile.title_keywords,
+                "profile_keywords": profile.profile_keywords,
+                "industry_keywords": profile.industry_keywords,
+                "exclusion_phrases": profile.exclusion_phrases,
+                "min_match_score": profile.min_match_score,
+                "max_message_tokens": profile.max_message_tokens,
+            },
+            "scan_depth_days": config.scan_depth_days,
+            "banned_message_links": config.banned_message_links,
+        }
 
     def _from_dict(self, raw: dict[str, Any]) -> AppConfig:
-        telegram = raw.get("telegram", {})
-        profile = raw.get("job_profile", {})
+        # Shape check once up front so every .get below runs against a dict.
+        if not isinstance(raw, dict):
+            raise ValueError("config root must be an object")
+        telegram = self._section(raw, "telegram")
+        profile = self._section(raw, "job_profile")
 
         telegram_settings = TelegramSettings(
             api_id=str(telegram.get("api_id", "") or ""),
@@ -67,12 +194,12 @@ class ConfigStore:
             phone_number=str(telegram.get("phone_number", "") or ""),
         )
 
+        normalize_list = self._normalize_list
+        keywords = {name: normalize_list(profile.get(name, []), lowercase=True) for name in _KEYWORD_FIELDS}
         job_profile = JobProfileSettings(
-            title_keywords=self._normalize_list(profile.get("title_keywords", []), lowercase=True),
-            profile_keywords=self._normalize_list(profile.get("profile_keywords", []), lowercase=True),
-            industry_keywords=self._normalize_list(profile.get("industry_keywords", []), lowercase=True),
-            exclusion_phrases=self._normalize_list(profile.get("exclusion_phrases", []), lowercase=True),
+            **keywords,
             min_match_score=self._normalize_score(profile.get("min_match_score", 2)),
+            max_message_tokens=self._normalize_tokens(profile.get("max_message_tokens", 2000)),
         )
 
         selected_chats = self._normalize_list(raw.get("selected_chats", []), lowercase=False)
@@ -87,17 +214,26 @@ class ConfigStore:
             banned_message_links=banned_message_links,
         )
 
+    @staticmethod
+    def _section(raw: dict[str, Any], key: str) -> dict[str, Any]:
+        section = raw.get(key)
+        return section if isinstance(section, dict) else {}
+
     @staticmethod
     def _normalize_list(values: Any, *, lowercase: bool) -> list[str]:
-        if not isinstance(values, list):
-            return []
-        normalized: list[str] = []
-        for item in values:
-            value = str(item).strip()
-            if not value:
-                continue
-            normalized.append(value.lower() if lowercase else value)
-        return normalized
+        if not isinstance(values, (list, tuple)):
+            # A bare string or mapping is a malformed value, not a list of items.
+            if values is None or isinstance(values, (str, bytes, dict)):
+                return []
+            try:
+                values = list(values)
+            except TypeError:
+                return []
+        stripped = map(str.strip, map(str, values))
+        # dict.fromkeys drops repeats while keeping first-seen order; interning lets reloads share strings.
+        if lowercase:
+            return list(dict.fromkeys(sys.intern(value.lower()) for value in stripped if value))
+        return list(dict.fromkeys(sys.intern(value) for value in stripped if value))
 
     @staticmethod
     def _normalize_score(value: Any) -> int:
@@ -105,7 +241,7 @@ class ConfigStore:
             score = int(value)
         except (TypeError, ValueError):
             return 2
-        return max(1, min(3, score))
+        return 1 if score < 1 else 3 if score > 3 else score
 
     @staticmethod
     def _normalize_days(value: Any) -> int:
@@ -113,4 +249,12 @@ class ConfigStore:
             days = int(value)
         except (TypeError, ValueError):
             return 14
-        return max(1, min(365, days))
+        return 1 if days < 1 else 365 if days > 365 else days
+
+    @staticmethod
+    def _normalize_tokens(value: Any) -> int:
+        try:
+            tokens = int(value)
+        except (TypeError, ValueError):
+            return 2000
+        return 50 if tokens < 50 else 100_000 if tokens > 100_000 else tokens
@@ -1,15 +1,19 @@
 from __future__ import annotations
 
+import bisect
+import functools
+import hashlib
+import itertools
 import logging
 import sys
-import time
+import threading
 from pathlib import Path
 
-from PySide6.QtCore import QRectF, Qt, QUrl
-from PySide6.QtGui import QBrush, QColor, QDesktopServices, QPainter, QPainterPath, QPen, QPixmap
-from PySide6.QtWidgets import QApplication
+from PySide6.QtCore import QElapsedTimer, QPointF, QRectF, QSize, Qt, QThread, QTimer, QUrl
+from PySide6.QtGui import QBrush, QColor, QDesktopServices, QImage, QPainter, QPen, QPixmap, QPixmapCache
 from PySide6.QtWidgets import (
     QAbstractItemView,
+    QApplication,
     QFrame,
     QGraphicsOpacityEffect,
     QGridLayout,
@@ -20,98 +24,388 @@ from PySide6.QtWidgets import (
     QLineEdit,
     QMainWindow,
     QMessageBox,
+    QPlainTextEdit,
     QPushButton,
     QSizePolicy,
     QSpinBox,
     QTableWidget,
     QTableWidgetItem,
-    QTextEdit,
     QVBoxLayout,
     QWidget,
 )
 
 from tjr.core.input_parser import parse_chat_sources_text, parse_search_terms_text
 from tjr.core.logging_setup import reset_log_file
-from tjr.core.scanner import MatchRecord, ScanProgress, run_scan
+from tjr.core.scanner import MatchRecord, ScanProgress, ScanReport
 from tjr.storage.config_store import AppConfig, ConfigStore
 from tjr.ui.results_window import MatchResultsDialog
+from tjr.ui.scan_worker import ScanWorker
 from tjr.ui.settings_dialog import SettingsDialog
-from tjr.ui.smooth_scroll import enable_smooth_wheel_scroll
+from tjr.ui.smooth_scroll import SmoothPlainTextEdit, enable_smooth_wheel_scroll, register_smooth_scroll
 
 logger = logging.getLogger(__name__)
 
+_LIVE_FEED_LIMIT = 120
+_PREVIEW_ROW_LIMIT = 40
+_LEFT_HERO_ASSET = "assets/illustrations/left-hero-v1.png"
+_LEFT_HERO_CACHE_KEY = "tjr/left-hero-v1"
+
+_STYLESHEET = """
+QMainWindow {
+    background: #06090f;
+    color: #e8f2ff;
+}
+QStatusBar {
+    background: #0b1320;
+    color: #9ab5d2;
+    border-top: 1px solid #1b2a3b;
+}
+#LeftPanel, #RightPanel {
+    background: #0b1420;
+    border-radius: 22px;
+}
+#LeftHeroArt {
+    color: #7f9dbf;
+    font-size: 20px;
+    font-weight: 800;
+}
+#TopBar {
+    background: #121e2d;
+    border-radius: 14px;
+}
+#MainTitle {
+    color: #f3f9ff;
+    font-size: 28px;
+    font-weight: 800;
+}
+#GhostButton {
+    background: #16324d;
+    color: #d7eafc;
+    border: none;
+    border-radius: 10px;
+    padding: 8px 16px;
+    font-size: 13px;
+    font-weight: 700;
+    text-align: center;
+}
+#GhostButton:disabled {
+    color: #63809b;
+    background: #122436;
+}
+#StartButton {
+    background: #1cc587;
+    color: #042118;
+    border: none;
+    border-radius: 12px;
+    padding: 12px 16px;
+    font-size: 17px;
+    font-weight: 800;
+    text-align: center;
+}
+#StartButton:disabled {
+    background: #25644d;
+    color: #9fd0ba;
+}
+#StartButton:pressed {
+    background: #19B37D;
+    color: #021912;
+    padding-top: 14px;
+}
+#StopButton {
+    background: #17314a;
+    color: #d4e8fb;
+    border: none;
+    border-radius: 12px;
+    padding: 12px 16px;
+    font-size: 16px;
+    font-weight: 700;
+    text-align: center;
+}
+#StopButton:disabled {
+    background: #7B4856;
+    color: #E6D9DE;
+}
+#StopButton:pressed {
+    background: #7F4150;
+    color: #F2E7EA;
+    padding-top: 14px;
+}
+#HeroCounter, #HeroStatus, #MetricCard, #FeedCard, #QuickSettingsCard {
+    background: #0f1b2a;
+    border-radius: 18px;
+}
+#HeroCounter {
+    background: #122338;
+}
+#HeroTitle {
+    color: #86abd0;
+    font-size: 12px;
+    font-weight: 700;
+    letter-spacing: 0.5px;
+}
+#LiveCounter {
+    color: #ffffff;
+    font-weight: 900;
+}
+#StatusPrimary {
+    color: #ffffff;
+    font-size: 18px;
+    font-weight: 800;
+}
+#StatusSecondary {
+    color: #a7c2de;
+    font-size: 12px;
+    font-weight: 600;
+}
+#MetricTitle {
+    color: #7f9dbf;
+    font-size: 12px;
+    font-weight: 700;
+    letter-spacing: 0.4px;
+}
+#MetricValue {
+    color: #f3f9ff;
+    font-size: 44px;
+    font-weight: 900;
+}
+#QuickSettingsCard QLabel {
+    color: #c9ddf2;
+    font-size: 13px;
+    font-weight: 600;
+}
+#QuickSettingsCard QPlainTextEdit, #QuickSettingsCard QSpinBox {
+    background: #0d1826;
+    color: #e6f1ff;
+    border: 1px solid #1a2b3e;
+    border-radius: 8px;
+    padding: 6px 8px;
+    font-size: 13px;
+}
+#QuickSettingsCard QSpinBox::up-button, #QuickSettingsCard QSpinBox::down-button {
+    width: 20px;
+}
+#FeedTable {
+    background: #0d1826;
+    border: 1px solid #1a2b3e;
+    border-radius: 10px;
+    gridline-color: #1c2c3f;
+    color: #e6f1ff;
+    font-size: 13px;
+}
+#FeedTable QHeaderView::section {
+    background: #14273b;
+    color: #8fb4d8;
+    border: none;
+    padding: 10px 8px;
+    font-size: 12px;
+    font-weight: 700;
+}
+#FeedTable::item {
+    padding: 8px;
+}
+#SortToggleButton {
+    background: #27496D;
+    color: #EAF2FF;
+    border: none;
+    border-radius: 8px;
+    font-size: 13px;
+    font-weight: 700;
+    text-align: center;
+    padding: 0 10px;
+}
+#SortToggleButton:hover {
+    background: #31577F;
+}
+#FeedBanButton {
+    background: transparent;
+    border: none;
+    color: #A9BCD3;
+    font-size: 13px;
+    font-weight: 700;
+    padding: 0;
+}
+#FeedBanButton:checked {
+    color: #F08DA0;
+}
+#FeedBanButton:hover {
+    color: #D9E5F2;
+}
+QToolTip {
+    background: #122338;
+    color: #f3f9ff;
+    border: 1px solid #2c4866;
+    padding: 8px 10px;
+    font-size: 14px;
+    font-weight: 400;
+}
+"""
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_asset_path(relative_path: str) -> Path | None:
+    # Bundled assets do not move while the app runs; probe the filesystem once per path.
+    relative = Path(relative_path)
+    candidates: list[Path] = []
+    if getattr(sys, "frozen", False):
+        meipass = getattr(sys, "_MEIPASS", None)
+        if meipass:
+            candidates.append(Path(meipass) / relative)
+    candidates.append(Path(__file__).resolve().parents[3] / relative)
+    for candidate in candidates:
+        if candidate.exists():
+            return candidate
+    return None
+
 
 class RoundedImageLabel(QLabel):
+    _TINT_COLOR = QColor(8, 18, 33, 35)
+    _FALLBACK_FILL = QColor("#0d1826")
+    _FALLBACK_TEXT_COLOR = QColor("#7f9dbf")
+    _BORDER_PEN = QPen(QColor("#1a2b3e"), 1)
+
     def __init__(self, radius: int = 14, parent: QWidget | None = None) -> None:
         super().__init__(parent)
         self._radius = radius
         self._source_pixmap = QPixmap()
+        # Source pixmap pre-scaled to the widget's device-pixel size; rebuilt only on resize.
+        self._scaled_cache: QPixmap | None = None
+        self._scaled_size: tuple[int, int] | None = None
+        # Rounded-corner alpha mask at the same device size; replaces a per-paint clip path.
+        self._mask: QImage | None = None
+        # Fully composed frame (pixmap, tint, mask, border); paintEvent is a single blit of it.
+        self._frame: QImage | None = None
+        self._frame_valid = False
         self._fallback_text = "TJR"
         self.setAlignment(Qt.AlignCenter)
 
     def set_source_pixmap(self, pixmap: QPixmap) -> None:
         self._source_pixmap = pixmap
+        self._scaled_cache = None
+        self._scaled_size = None
+        self._frame_valid = False
         self.update()
 
     def set_fallback_text(self, text: str) -> None:
         self._fallback_text = text
+        self._frame_valid = False
         self.update()
 
     def paintEvent(self, event) -> None:  # noqa: N802
         del event
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        painter.setRenderHint(QPainter.SmoothPixmapTransform)
+        painter.drawImage(0, 0, self._rendered_frame())
+
+    def _rendered_frame(self) -> QImage:
+        mask = self._rounded_mask()
+        frame = self._frame
+        if frame is not None and self._frame_valid and frame.size() == mask.size():
+            if frame.devicePixelRatio() == mask.devicePixelRatio():
+                return frame
+        if frame is None or frame.size() != mask.size():
+            frame = QImage(mask.size(), QImage.Format_ARGB32_Premultiplied)
+        frame.setDevicePixelRatio(mask.devicePixelRatio())
+        frame.fill(Qt.transparent)
 
         rect = QRectF(self.rect()).adjusted(0.5, 0.5, -0.5, -0.5)
-        path = QPainterPath()
-        path.addRoundedRect(rect, self._radius, self._radius)
-        painter.setClipPath(path)
-
+        # The cached pixmap is already at device size, so fills and the blit need no AA or smoothing.
+        painter = QPainter(frame)
         if not self._source_pixmap.isNull():
-            src = self._source_pixmap
-            dst_ratio = rect.width() / max(1.0, rect.height())
-            src_ratio = src.width() / max(1, src.height())
-            if src_ratio > dst_ratio:
-                target_h = rect.height()
-                target_w = target_h * src_ratio
-            else:
-                target_w = rect.width()
-                target_h = target_w / src_ratio
-            x = rect.x() + (rect.width() - target_w) / 2.0
-            y = rect.y() + (rect.height() - target_h) / 2.0
-            target = QRectF(x, y, target_w, target_h)
-            painter.drawPixmap(target, src, QRectF(src.rect()))
-            painter.fillRect(rect, QColor(8, 18, 33, 35))
+            scaled = self._scaled_pixmap()
+            x = (self.width() - scaled.width() / scaled.devicePixelRatio()) / 2.0
+            y = (self.height() - scaled.height() / scaled.devicePixelRatio()) / 2.0
+            painter.drawPixmap(QPointF(x, y), scaled)
+            painter.fillRect(rect, self._TINT_COLOR)
         else:
-            painter.fillRect(rect, QColor("#0d1826"))
-            painter.setPen(QColor("#7f9dbf"))
+            painter.fillRect(rect, self._FALLBACK_FILL)
+            painter.setPen(self._FALLBACK_TEXT_COLOR)
+            painter.setFont(self.font())
             painter.drawText(rect, Qt.AlignCenter, self._fallback_text)
-
-        painter.setClipping(False)
-        painter.setPen(QPen(QColor("#1a2b3e"), 1))
+        painter.setCompositionMode(QPainter.CompositionMode_DestinationIn)
+        painter.drawImage(0, 0, mask)
+        painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(self._BORDER_PEN)
         painter.drawRoundedRect(rect, self._radius, self._radius)
+        painter.end()
+
+        self._frame = frame
+        self._frame_valid = True
+        return frame
+
+    def _rounded_mask(self) -> QImage:
+        ratio = self.devicePixelRatioF()
+        width = max(1, round(self.width() * ratio))
+        height = max(1, round(self.height() * ratio))
+        mask = self._mask
+        if mask is None or mask.width() != width or mask.height() != height or mask.devicePixelRatio() != ratio:
+            mask = QImage(width, height, QImage.Format_ARGB32_Premultiplied)
+            mask.setDevicePixelRatio(ratio)
+            mask.fill(Qt.transparent)
+            mask_painter = QPainter(mask)
+            mask_painter.setRenderHint(QPainter.Antialiasing)
+            mask_painter.setPen(Qt.NoPen)
+            mask_painter.setBrush(Qt.white)
+            rect = QRectF(self.rect()).adjusted(0.5, 0.5, -0.5, -0.5)
+            mask_painter.drawRoundedRect(rect, self._radius, self._radius)
+            mask_painter.end()
+            self._mask = mask
+        return mask
+
+    def _scaled_pixmap(self) -> QPixmap:
+        ratio = self.devicePixelRatioF()
+        size = (max(1, round(self.width() * ratio)), max(1, round(self.height() * ratio)))
+        if self._scaled_cache is None or self._scaled_size != size:
+            self._scaled_cache = self._source_pixmap.scaled(
+                QSize(*size), Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation
+            )
+            self._scaled_cache.setDevicePixelRatio(ratio)
+            self._scaled_size = size
+        return self._scaled_cache
 
 
 class MainWindow(QMainWindow):
+    # Shared by every feed cell; avoids parsing the color string per item.
+    _ACCENT_BRUSH = QBrush(QColor(0x7D, 0xE0, 0xBB))
+
     def __init__(self, config_store: ConfigStore, config: AppConfig) -> None:
         super().__init__()
         self._config_store = config_store
         self._config = config
+        # Insertion-ordered set of banned links; the config list is rebuilt from it when a ban changes.
+        self._banned_index: dict[str, None] = dict.fromkeys(config.banned_message_links)
         self._results_dialog: MatchResultsDialog | None = None
+        self._settings_dialog: SettingsDialog | None = None
         self._last_report_records: list[MatchRecord] = []
+        # Kept newest first; _live_feed_order holds the matching -timestamp bisect keys.
         self._live_feed_records: list[MatchRecord] = []
-        self._scan_started_at: float = 0.0
+        self._live_feed_order: list[float] = []
+        self._live_feed_keys: set[str] = set()
+        self._scan_timer = QElapsedTimer()
         self._live_matches_count: int = 0
         self._preview_sort_descending: bool = True
-        self._cancel_scan_requested = False
+        self._cancel_scan_requested = threading.Event()
         self._is_scanning = False
+        # Set when a quick-settings widget is edited; clean inputs are not re-parsed or re-saved.
+        self._quick_dirty = False
+        self._scan_thread: QThread | None = None
+        self._scan_worker: ScanWorker | None = None
+        # Telegram code/password dialog open for the scan thread, rejected if the window closes.
+        self._prompt_dialog: QInputDialog | None = None
+        self._close_after_scan = False
+        self._pending_progress: ScanProgress | None = None
+        self._pending_matches: list[MatchRecord] = []
+        # Progress events are buffered and applied at ~15 Hz, so widget repaints do not track the scan rate.
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(66)
+        self._progress_timer.timeout.connect(self._flush_scan_progress)
 
         self.setWindowTitle("TJR - Telegram Job Radar")
         self.resize(1440, 900)
         self._apply_theme()
 
         central_widget = QWidget(self)
+        # No repaints while the widget tree is assembled; re-enabled once it is populated.
+        central_widget.setUpdatesEnabled(False)
         self.setCentralWidget(central_widget)
         root = QHBoxLayout(central_widget)
         root.setContentsMargins(20, 20, 20, 20)
@@ -144,20 +438,18 @@ class MainWindow(QMainWindow):
         quick_chats_label.setObjectName("QuickLabel")
         quick_settings_layout.addWidget(quick_chats_label)
 
-        self.quick_chats_input = QTextEdit()
+        self.quick_chats_input = SmoothPlainTextEdit()
         self.quick_chats_input.setPlaceholderText("@chat_one @chat_two или https://t.me/channel/123")
         self.quick_chats_input.setMinimumHeight(84)
-        enable_smooth_wheel_scroll(self.quick_chats_input, speed_factor=0.68, duration_ms=110)
         quick_settings_layout.addWidget(self.quick_chats_input)
 
         quick_title_label = QLabel("Совпадение по названию")
         quick_title_label.setObjectName("QuickLabel")
         quick_settings_layout.addWidget(quick_title_label)
 
-        self.quick_title_input = QTextEdit()
+        self.quick_title_input = SmoothPlainTextEdit()
         self.quick_title_input.setPlaceholderText("ceo / исполнительный директор / операционный директор")
         self.quick_title_input.setMinimumHeight(72)
-        enable_smooth_wheel_scroll(self.quick_title_input, speed_factor=0.68, duration_ms=110)
         quick_settings_layout.addWidget(self.quick_title_input)
 
         quick_depth_label = QLabel("Глубина поиска (дней)")
@@ -178,11 +470,16 @@ class MainWindow(QMainWindow):
         quick_exclusion_label.setObjectName("QuickLabel")
         quick_settings_layout.addWidget(quick_exclusion_label)
 
-        self.quick_exclusion_input = QTextEdit()
+        self.quick_exclusion_input = SmoothPlainTextEdit()
         self.quick_exclusion_input.setPlaceholderText("курсы для директора / рекомендую кандидата")
         self.quick_exclusion_input.setMinimumHeight(72)
-        enable_smooth_wheel_scroll(self.quick_exclusion_input, speed_factor=0.68, duration_ms=110)
         quick_settings_layout.addWidget(self.quick_exclusion_input)
+        register_smooth_scroll(
+            quick_settings_card,
+            (self.quick_chats_input, self.quick_title_input, self.quick_exclusion_input),
+            speed_factor=0.68,
+            duration_ms=110,
+        )
 
         self.apply_quick_settings_button = QPushButton("Применить")
         self.apply_quick_settings_button.setObjectName("GhostButton")
@@ -347,44 +644,43 @@ class MainWindow(QMainWindow):
 
         self.statusBar().showMessage("Готово")
         self._populate_quick_settings_inputs()
+        self.quick_chats_input.textChanged.connect(self._mark_quick_dirty)
+        self.quick_title_input.textChanged.connect(self._mark_quick_dirty)
+        self.quick_exclusion_input.textChanged.connect(self._mark_quick_dirty)
+        self.quick_depth_input.valueChanged.connect(self._mark_quick_dirty)
+        # Decoded once; RoundedImageLabel re-fits the stored pixmap on every paint, so resizes need no reload.
         self._refresh_left_hero_art()
         self._update_sort_toggle_text()
-        self._refresh_preview_table([])
+        self._rebuild_preview_table([])
+        central_widget.setUpdatesEnabled(True)
 
     def _open_settings(self) -> None:
         self._apply_quick_settings_inputs(show_feedback=False)
-        dialog = SettingsDialog(config=self._config, parent=self)
-        if dialog.exec():
+        dialog = self._settings_dialog
+        if dialog is None:
+            dialog = self._settings_dialog = SettingsDialog(config=self._config, parent=self)
+        else:
+            dialog.reload(self._config)
+        if not dialog.exec():
+            return
+        # The dialog hands back the very same config when nothing was edited.
+        if dialog.config is not self._config:
             self._config = dialog.config
+            self._banned_index = dict.fromkeys(self._config.banned_message_links)
             self._config_store.save(self._config)
             self._populate_quick_settings_inputs()
-            self.blocked_value_label.setText(str(len(self._config.banned_message_links)))
-            self.channels_value_label.setText(str(len(self._config.selected_chats)))
-            self.depth_days_value_label.setText(str(self._config.scan_depth_days))
-            self.statusBar().showMessage("Настройки сохранены", 3000)
-
-    @staticmethod
-    def _resolve_asset_path(relative_path: str) -> Path | None:
-        relative = Path(relative_path)
-        candidates: list[Path] = []
-        if getattr(sys, "frozen", False):
-            meipass = getattr(sys, "_MEIPASS", None)
-            if meipass:
-                candidates.append(Path(meipass) / relative)
-        candidates.append(Path(__file__).resolve().parents[3] / relative)
-        for candidate in candidates:
-            if candidate.exists():
-                return candidate
-        return None
+            self._set_label(self.blocked_value_label, str(len(self._config.banned_message_links)))
+            self._set_label(self.channels_value_label, str(len(self._config.selected_chats)))
+            self._set_label(self.depth_days_value_label, str(self._config.scan_depth_days))
+        self.statusBar().showMessage("Настройки сохранены", 3000)
 
     def _refresh_left_hero_art(self) -> None:
-        asset_path = self._resolve_asset_path("assets/illustrations/left-hero-v1.png")
-        if asset_path is None:
-            self.left_hero_art_label.set_source_pixmap(QPixmap())
-            self.left_hero_art_label.set_fallback_text("TJR")
-            return
-
-        pixmap = QPixmap(str(asset_path))
+        # QPixmapCache is process-wide, so later windows reuse the decoded image.
+        pixmap = QPixmap()
+        if not QPixmapCache.find(_LEFT_HERO_CACHE_KEY, pixmap):
+            asset_path = _resolve_asset_path(_LEFT_HERO_ASSET)
+            if asset_path is not None and pixmap.load(str(asset_path)):
+                QPixmapCache.insert(_LEFT_HERO_CACHE_KEY, pixmap)
         if pixmap.isNull():
             self.left_hero_art_label.set_source_pixmap(QPixmap())
             self.left_hero_art_label.set_fallback_text("TJR")
@@ -393,13 +689,29 @@ class MainWindow(QMainWindow):
         self.left_hero_art_label.set_source_pixmap(pixmap)
 
     def _populate_quick_settings_inputs(self) -> None:
-        self.quick_chats_input.setPlainText("\n".join(self._config.selected_chats))
-        self.quick_title_input.setPlainText(self._join_terms_for_display(self._config.job_profile.title_keywords))
+        profile = self._config.job_profile
+        self._set_plain_text(self.quick_chats_input, "\n".join(self._config.selected_chats))
+        self._set_plain_text(self.quick_title_input, self._join_terms_for_display(profile.title_keywords))
         self.quick_depth_input.setValue(self._config.scan_depth_days)
-        self.quick_exclusion_input.setPlainText(self._join_terms_for_display(self._config.job_profile.exclusion_phrases))
+        self._set_plain_text(self.quick_exclusion_input, self._join_terms_for_display(profile.exclusion_phrases))
+        self._quick_dirty = False
+
+    @staticmethod
+    def _set_plain_text(editor: QPlainTextEdit, text: str) -> None:
+        # setPlainText re-lays out the whole document and resets the cursor; skip it when nothing changes.
+        if editor.toPlainText() != text:
+            editor.setPlainText(text)
+
+    def _mark_quick_dirty(self, *args: object) -> None:
+        del args
+        self._quick_dirty = True
 
     def _apply_quick_settings_inputs(self, checked: bool = False, *, show_feedback: bool = True) -> bool:
         del checked
+        if not self._quick_dirty:
+            if show_feedback:
+                self.statusBar().showMessage("Быстрые настройки применены", 2500)
+            return True
         self._config.selected_chats = parse_chat_sources_text(self.quick_chats_input.toPlainText())
         self._config.job_profile.title_keywords = parse_search_terms_text(self.quick_title_input.toPlainText())
         self._config.job_profile.exclusion_phrases = parse_search_terms_text(self.quick_exclusion_input.toPlainText())
@@ -407,9 +719,9 @@ class MainWindow(QMainWindow):
         self._config_store.save(self._config)
 
         self._populate_quick_settings_inputs()
-        self.channels_value_label.setText(str(len(self._config.selected_chats)))
-        self.blocked_value_label.setText(str(len(self._config.banned_message_links)))
-        self.depth_days_value_label.setText(str(self._config.scan_depth_days))
+        self._set_label(self.channels_value_label, str(len(self._config.selected_chats)))
+        self._set_label(self.blocked_value_label, str(len(self._config.banned_message_links)))
+        self._set_label(self.depth_days_value_label, str(self._config.scan_depth_days))
         if show_feedback:
             self.statusBar().showMessage("Быстрые настройки применены", 2500)
         return True
@@ -441,45 +753,64 @@ class MainWindow(QMainWindow):
         logger.info("Chat scan started")
 
         self._is_scanning = True
-        self._cancel_scan_requested = False
-        self._scan_started_at = time.monotonic()
+        self._cancel_scan_requested.clear()
+        self._scan_timer.start()
 
         self.run_button.setEnabled(False)
         self.stop_button.setEnabled(True)
         self.stop_button.setText("Stop Scan")
         self.settings_button.setEnabled(False)
 
-        self._live_feed_records = []
-        self._refresh_preview_table([])
+        self._reset_live_feed([])
         self._set_live_matches_count(0)
 
-        self.scan_status_value_label.setText(f"Chat 0 / {max(1, len(self._config.selected_chats))}")
-        self.scan_status_detail_label.setText("Старт сканирования...")
-        self.channels_value_label.setText(str(len(self._config.selected_chats)))
-        self.blocked_value_label.setText(str(len(self._config.banned_message_links)))
-        self.depth_days_value_label.setText(str(self._config.scan_depth_days))
+        self._set_label(self.scan_status_value_label, f"Chat 0 / {max(1, len(self._config.selected_chats))}")
+        self._set_label(self.scan_status_detail_label, "Старт сканирования...")
+        self._set_label(self.channels_value_label, str(len(self._config.selected_chats)))
+        self._set_label(self.blocked_value_label, str(len(self._config.banned_message_links)))
+        self._set_label(self.depth_days_value_label, str(self._config.scan_depth_days))
+        # Live progress is on the status card; the status bar only says a scan is running.
+        self.statusBar().showMessage("Сканирование...")
+
+        # The worker reads a private snapshot; quick settings may be edited while it runs.
+        worker = ScanWorker(self._config.copy(), should_stop=self._cancel_scan_requested.is_set)
+        thread = QThread(self)
+        worker.moveToThread(thread)
+        thread.started.connect(worker.run)
+        worker.progress.connect(self._on_scan_progress)
+        worker.prompt_requested.connect(self._on_scan_prompt, Qt.BlockingQueuedConnection)
+        worker.finished.connect(self._on_scan_finished)
+        worker.failed.connect(self._on_scan_failed)
+        worker.finished.connect(thread.quit)
+        worker.failed.connect(thread.quit)
+        thread.finished.connect(worker.deleteLater)
+        thread.finished.connect(thread.deleteLater)
+        self._scan_thread = thread
+        self._scan_worker = worker
+        thread.start()
+
+    def _finish_scan_ui(self) -> None:
+        self._is_scanning = False
+        self._scan_thread = None
+        self._scan_worker = None
+        self._progress_timer.stop()
+        self._pending_progress = None
+        self._pending_matches = []
+        self.run_button.setEnabled(True)
+        self.stop_button.setEnabled(False)
+        self.stop_button.setText("Stop Scan")
+        self.settings_button.setEnabled(True)
 
-        try:
-            report = run_scan(
-                self._config,
-                request_code=self._request_telegram_code,
-                request_password=self._request_telegram_password,
-                progress_callback=self._on_scan_progress,
-                should_stop=self._should_stop_scan,
-            )
-        except Exception as exc:  # noqa: BLE001
-            logger.exception("Chat scan failed")
-            self.statusBar().showMessage("Проверка прервана", 4000)
-            self.scan_status_detail_label.setText(f"Ошибка: {exc}")
-            QMessageBox.warning(self, "Ошибка сканирования", str(exc))
+    def _on_scan_failed(self, exc: Exception) -> None:
+        self._finish_scan_ui()
+        if self._close_after_scan:
             return
-        finally:
-            self._is_scanning = False
-            self.run_button.setEnabled(True)
-            self.stop_button.setEnabled(False)
-            self.stop_button.setText("Stop Scan")
-            self.settings_button.setEnabled(True)
+        self.statusBar().showMessage("Проверка прервана", 4000)
+        self._set_label(self.scan_status_detail_label, f"Ошибка: {exc}")
+        QMessageBox.warning(self, "Ошибка сканирования", str(exc))
 
+    def _on_scan_finished(self, report: ScanReport) -> None:
+        self._finish_scan_ui()
         logger.info(
             "Chat scan completed | chats=%s | messages=%s | matches=%s | canceled=%s",
             report.scanned_chats,
@@ -489,23 +820,25 @@ class MainWindow(QMainWindow):
         )
 
         self._set_live_matches_count(len(report.matched_records))
-        self._live_feed_records = list(report.matched_records)
-        self._refresh_preview_table(self._live_feed_records)
+        self._reset_live_feed(report.matched_records)
 
-        self.depth_days_value_label.setText(str(self._config.scan_depth_days))
+        self._set_label(self.depth_days_value_label, str(self._config.scan_depth_days))
 
-        self.scan_status_value_label.setText(
-            f"Chat {report.scanned_chats} / {max(report.scanned_chats, len(self._config.selected_chats))}"
+        self._set_label(
+            self.scan_status_value_label,
+            f"Chat {report.scanned_chats} / {max(report.scanned_chats, len(self._config.selected_chats))}",
         )
 
         if report.canceled:
-            self.scan_status_detail_label.setText(
-                f"Остановлено пользователем. Проверено сообщений: {report.scanned_messages}"
+            self._set_label(
+                self.scan_status_detail_label,
+                f"Остановлено пользователем. Проверено сообщений: {report.scanned_messages}",
             )
             self.statusBar().showMessage("Сканирование остановлено", 4000)
         else:
-            self.scan_status_detail_label.setText(
-                f"Завершено. Чатов: {report.scanned_chats}, сообщений: {report.scanned_messages}"
+            self._set_label(
+                self.scan_status_detail_label,
+                f"Завершено. Чатов: {report.scanned_chats}, сообщений: {report.scanned_messages}",
             )
             self.statusBar().showMessage("Проверка завершена", 3000)
 
@@ -514,7 +847,21 @@ class MainWindow(QMainWindow):
             self.open_last_report_button.setEnabled(True)
 
     def _on_scan_progress(self, progress: ScanProgress) -> None:
-        elapsed = max(0.0, time.monotonic() - self._scan_started_at)
+        self._pending_progress = progress
+        if progress.phase == "match_found" and progress.latest_match is not None:
+            self._pending_matches.append(progress.latest_match)
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+
+    def _flush_scan_progress(self) -> None:
+        progress = self._pending_progress
+        if progress is None:
+            self._progress_timer.stop()
+            return
+        self._pending_progress = None
+        matches, self._pending_matches = self._pending_matches, []
+
+        elapsed = self._scan_timer.elapsed() / 1000.0 if self._scan_timer.isValid() else 0.0
         eta_text = "оценка после 1-го чата"
         if progress.completed_chats > 0 and progress.total_chats > progress.completed_chats:
             avg_per_chat = elapsed / progress.completed_chats
@@ -525,99 +872,122 @@ class MainWindow(QMainWindow):
 
         current_step = min(progress.total_chats, max(1, progress.current_chat_index))
         self._set_live_matches_count(progress.matched_count)
-        self.scan_status_value_label.setText(f"Chat {current_step} / {max(1, progress.total_chats)}")
-        self.scan_status_detail_label.setText(
-            f"{progress.current_chat} | scanned: {progress.scanned_messages} | ETA: {eta_text}"
+        self._set_label(self.scan_status_value_label, f"Chat {current_step} / {max(1, progress.total_chats)}")
+        self._set_label(
+            self.scan_status_detail_label,
+            f"{progress.current_chat} | scanned: {progress.scanned_messages} | ETA: {eta_text}",
         )
 
-        self.channels_value_label.setText(str(max(0, progress.total_chats)))
-        self.blocked_value_label.setText(str(len(self._config.banned_message_links)))
-        self.depth_days_value_label.setText(str(self._config.scan_depth_days))
+        self._set_label(self.channels_value_label, str(max(0, progress.total_chats)))
+        self._set_label(self.blocked_value_label, str(len(self._config.banned_message_links)))
+        self._set_label(self.depth_days_value_label, str(self._config.scan_depth_days))
 
-        if progress.phase == "match_found" and progress.latest_match is not None:
-            self._append_live_match(progress.latest_match)
+        if matches:
+            self._insert_live_matches(matches)
 
-        self.statusBar().showMessage(
-            (
-                f"Прогресс: чат {current_step}/{max(1, progress.total_chats)} | "
-                f"сообщений: {progress.scanned_messages} | найдено: {progress.matched_count} | ETA: {eta_text}"
-            )
-        )
-        QApplication.processEvents()
+    def _reset_live_feed(self, records: list[MatchRecord]) -> None:
+        self._live_feed_records = sorted(records, key=lambda item: item.published_at, reverse=True)
+        self._live_feed_order = [-record.published_at.timestamp() for record in self._live_feed_records]
+        self._live_feed_keys = {self._record_key(record) for record in self._live_feed_records}
+        self._rebuild_preview_table(self._live_feed_records)
 
-    def _append_live_match(self, record: MatchRecord) -> None:
+    def _append_live_match(self, record: MatchRecord) -> int | None:
         key = self._record_key(record)
-        known_keys = {self._record_key(item) for item in self._live_feed_records}
-        if key in known_keys:
+        if key in self._live_feed_keys:
+            return None
+        sort_key = -record.published_at.timestamp()
+        index = bisect.bisect_left(self._live_feed_order, sort_key)
+        if index >= _LIVE_FEED_LIMIT:
+            return None
+        self._live_feed_order.insert(index, sort_key)
+        self._live_feed_records.insert(index, record)
+        self._live_feed_keys.add(key)
+        if len(self._live_feed_records) > _LIVE_FEED_LIMIT:
+            # The oldest record falls off the tail.
+            self._live_feed_order.pop()
+            self._live_feed_keys.discard(self._record_key(self._live_feed_records.pop()))
+        return index
+
+    def _on_scan_prompt(self, kind: str) -> None:
+        # Runs on the GUI thread while the scan thread blocks on the queued emit.
+        worker = self._scan_worker
+        if worker is None:
             return
-        self._live_feed_records.insert(0, record)
-        if len(self._live_feed_records) > 120:
-            self._live_feed_records = self._live_feed_records[:120]
-        self._refresh_preview_table(self._live_feed_records)
+        answer = None
+        if not self._cancel_scan_requested.is_set():
+            answer = self._request_telegram_password() if kind == "password" else self._request_telegram_code()
+        # A stop or close during the dialog cancels the login instead of sending the typed value.
+        worker.set_prompt_answer(None if self._cancel_scan_requested.is_set() else answer)
 
     def _request_telegram_code(self) -> str | None:
-        code, ok = QInputDialog.getText(
-            self,
-            "Код Telegram",
-            "Введите код из Telegram:",
-            QLineEdit.Normal,
-        )
-        if not ok:
-            return None
-        value = code.strip()
-        return value or None
+        return self._ask_scan_prompt("Код Telegram", "Введите код из Telegram:", QLineEdit.Normal)
 
     def _request_telegram_password(self) -> str | None:
-        password, ok = QInputDialog.getText(
-            self,
+        return self._ask_scan_prompt(
             "Пароль 2FA",
             "Введите пароль двухфакторной аутентификации:",
             QLineEdit.Password,
         )
+
+    def _ask_scan_prompt(self, title: str, label: str, echo_mode: QLineEdit.EchoMode) -> str | None:
+        dialog = QInputDialog(self)
+        dialog.setWindowTitle(title)
+        dialog.setLabelText(label)
+        dialog.setTextEchoMode(echo_mode)
+        self._prompt_dialog = dialog
+        try:
+            ok = dialog.exec() == QInputDialog.DialogCode.Accepted
+            value = dialog.textValue().strip()
+        finally:
+            self._prompt_dialog = None
+            dialog.deleteLater()
         if not ok:
             return None
-        value = password.strip()
         return value or None
 
+    def _is_message_link_banned(self, link: str) -> bool:
+        return link.strip() in self._banned_index
+
     def _ban_message_link(self, link: str, is_banned: bool) -> None:
         normalized = link.strip()
         if not normalized:
             return
-        if is_banned and normalized not in self._config.banned_message_links:
-            self._config.banned_message_links.append(normalized)
-            self._config_store.save(self._config)
-            self.blocked_value_label.setText(str(len(self._config.banned_message_links)))
+        if is_banned == (normalized in self._banned_index):
             return
-        if not is_banned and normalized in self._config.banned_message_links:
-            self._config.banned_message_links.remove(normalized)
-            self._config_store.save(self._config)
-            self.blocked_value_label.setText(str(len(self._config.banned_message_links)))
+        if is_banned:
+            self._banned_index[normalized] = None
+        else:
+            del self._banned_index[normalized]
+        self._config.banned_message_links = list(self._banned_index)
+        self._config_store.save(self._config)
+        self._set_label(self.blocked_value_label, str(len(self._banned_index)))
 
     def _open_last_report(self) -> None:
         if not self._last_report_records:
             QMessageBox.information(self, "Нет отчета", "Пока нет сохраненного отчета с совпадениями.")
             return
-        self._results_dialog = MatchResultsDialog(
-            list(self._last_report_records),
-            on_ban_message=self._ban_message_link,
-            parent=self,
-        )
+        # Built once and refilled on later opens instead of recreating every widget.
+        if self._results_dialog is None:
+            self._results_dialog = MatchResultsDialog(
+                [],
+                on_ban_message=self._ban_message_link,
+                is_banned=self._is_message_link_banned,
+                parent=self,
+            )
+        self._results_dialog.set_records(self._last_report_records)
         self._results_dialog.show()
+        self._results_dialog.raise_()
         self.statusBar().showMessage("Открыт последний отчет", 3000)
 
     def _request_stop_scan(self) -> None:
         if not self._is_scanning:
             return
-        self._cancel_scan_requested = True
+        self._cancel_scan_requested.set()
         self.stop_button.setEnabled(False)
         self.stop_button.setText("Stopping...")
-        self.scan_status_detail_label.setText("Остановка по запросу пользователя...")
+        self._set_label(self.scan_status_detail_label, "Остановка по запросу пользователя...")
         logger.info("Scan stop requested by user")
         self.statusBar().showMessage("Остановка сканирования...")
-        QApplication.processEvents()
-
-    def _should_stop_scan(self) -> bool:
-        return self._cancel_scan_requested
 
     def _on_preview_cell_clicked(self, row: int, column: int) -> None:
         if column != 3:
@@ -632,44 +1002,87 @@ class MainWindow(QMainWindow):
     def _toggle_preview_sort(self) -> None:
         self._preview_sort_descending = not self._preview_sort_descending
         self._update_sort_toggle_text()
-        self._refresh_preview_table(self._live_feed_records)
+        self._rebuild_preview_table(self._live_feed_records)
 
     def _update_sort_toggle_text(self) -> None:
         arrow = "↓" if self._preview_sort_descending else "↑"
         self.sort_toggle_button.setText(f"Сортировка: Дата {arrow}")
 
-    def _refresh_preview_table(self, records: list[MatchRecord]) -> None:
-        ordered = sorted(records, key=lambda item: item.published_at, reverse=self._preview_sort_descending)
-        visible = ordered[:40]
-        self.preview_table.clearContents()
-        self.preview_table.setRowCount(len(visible))
-
-        for row, record in enumerate(visible):
-            ban_button = self._build_feed_ban_button(record.link)
-            dt_item = QTableWidgetItem(record.published_at.strftime("%Y-%m-%d %H:%M"))
-            message_item = QTableWidgetItem(self._compact_message(record.text))
-            message_item.setToolTip(record.text)
-
-            link_item = QTableWidgetItem("Open")
-            link_item.setData(Qt.UserRole, record.link)
-            link_item.setToolTip(record.link)
-            link_item.setForeground(QBrush(QColor("#7de0bb")))
-
-            channel_item = QTableWidgetItem(record.channel)
-            if record.link:
-                channel_item.setToolTip(record.link)
-            channel_item.setForeground(QBrush(QColor("#7de0bb")))
-
-            matches_item = QTableWidgetItem(self._compact_terms(record))
-            matches_item.setForeground(QBrush(QColor("#7de0bb")))
-
-            self.preview_table.setCellWidget(row, 0, ban_button)
-            self.preview_table.setItem(row, 1, dt_item)
-            self.preview_table.setItem(row, 2, message_item)
-            self.preview_table.setItem(row, 3, link_item)
-            self.preview_table.setItem(row, 4, channel_item)
-            self.preview_table.setItem(row, 5, matches_item)
-            self.preview_table.resizeRowToContents(row)
+    def _rebuild_preview_table(self, records: list[MatchRecord]) -> None:
+        # records are newest first, as kept in _live_feed_records.
+        if self._preview_sort_descending:
+            visible = records[:_PREVIEW_ROW_LIMIT]
+        else:
+            visible = records[-_PREVIEW_ROW_LIMIT:][::-1]
+        table = self.preview_table
+        table.setUpdatesEnabled(False)
+        try:
+            table.clearContents()
+            table.setRowCount(len(visible))
+            for row, record in enumerate(visible):
+                self._fill_preview_row(row, record)
+            # One layout pass for all rows instead of one per row.
+            table.resizeRowsToContents()
+        finally:
+            table.setUpdatesEnabled(True)
+
+    def _insert_live_matches(self, records: list[MatchRecord]) -> None:
+        # Only the new rows get items; existing rows shift down instead of being rebuilt.
+        table = self.preview_table
+        descending = self._preview_sort_descending
+        rebuild = False
+        table.setUpdatesEnabled(False)
+        try:
+            for record in records:
+                was_full = len(self._live_feed_records) >= _LIVE_FEED_LIMIT
+                index = self._append_live_match(record)
+                if index is None or rebuild:
+                    continue
+                if descending:
+                    row = index
+                elif was_full:
+                    # The trimmed oldest record may be on screen in ascending order.
+                    rebuild = True
+                    continue
+                else:
+                    row = len(self._live_feed_records) - 1 - index
+                if row >= _PREVIEW_ROW_LIMIT:
+                    continue
+                table.insertRow(row)
+                self._fill_preview_row(row, record)
+                if table.rowCount() > _PREVIEW_ROW_LIMIT:
+                    table.removeRow(_PREVIEW_ROW_LIMIT)
+                table.resizeRowToContents(row)
+            if rebuild:
+                self._rebuild_preview_table(self._live_feed_records)
+        finally:
+            table.setUpdatesEnabled(True)
+
+    def _fill_preview_row(self, row: int, record: MatchRecord) -> None:
+        ban_button = self._build_feed_ban_button(record.link)
+        dt_item = QTableWidgetItem(record.published_at.isoformat(" ", "minutes")[:16])
+        message_item = QTableWidgetItem(self._compact_message(record.text))
+        message_item.setToolTip(record.text)
+
+        link_item = QTableWidgetItem("Open")
+        link_item.setData(Qt.UserRole, record.link)
+        link_item.setToolTip(record.link)
+        link_item.setForeground(self._ACCENT_BRUSH)
+
+        channel_item = QTableWidgetItem(record.channel)
+        if record.link:
+            channel_item.setToolTip(record.link)
+        channel_item.setForeground(self._ACCENT_BRUSH)
+
+        matches_item = QTableWidgetItem(self._compact_terms(record))
+        matches_item.setForeground(self._ACCENT_BRUSH)
+
+        self.preview_table.setCellWidget(row, 0, ban_button)
+        self.preview_table.setItem(row, 1, dt_item)
+        self.preview_table.setItem(row, 2, message_item)
+        self.preview_table.setItem(row, 3, link_item)
+        self.preview_table.setItem(row, 4, channel_item)
+        self.preview_table.setItem(row, 5, matches_item)
 
     def _build_feed_ban_button(self, link: str) -> QPushButton:
         button = QPushButton("🗑")
@@ -680,7 +1093,7 @@ class MainWindow(QMainWindow):
         button.setFocusPolicy(Qt.NoFocus)
 
         normalized = link.strip()
-        is_banned = bool(normalized and normalized in self._config.banned_message_links)
+        is_banned = bool(normalized and normalized in self._banned_index)
         button.setChecked(is_banned)
 
         opacity_effect = QGraphicsOpacityEffect(button)
@@ -706,9 +1119,15 @@ class MainWindow(QMainWindow):
         self._ban_message_link(link, is_banned)
         self._set_feed_ban_button_visual(button, is_banned)
 
+    @staticmethod
+    def _set_label(label: QLabel, text: str) -> None:
+        # setText invalidates layout and repaints even when the text is unchanged.
+        if label.text() != text:
+            label.setText(text)
+
     def _set_live_matches_count(self, value: int) -> None:
         self._live_matches_count = max(0, value)
-        self.live_matches_value_label.setText(str(self._live_matches_count))
+        self._set_label(self.live_matches_value_label, str(self._live_matches_count))
 
     @staticmethod
     def _compact_message(text: str, limit: int = 90) -> str:
@@ -719,15 +1138,20 @@ class MainWindow(QMainWindow):
 
     @staticmethod
     def _compact_terms(record: MatchRecord) -> str:
-        terms = (
-            record.match_result.matched_title_terms
-            + record.match_result.matched_profile_terms
-            + record.match_result.matched_industry_terms
-        )
-        if not terms:
-            return "-"
-        unique = list(dict.fromkeys(terms))
-        return " • ".join(unique[:3])
+        result = record.match_result
+        seen: set[str] = set()
+        unique: list[str] = []
+        # Only three terms are shown, so stop walking the lists once they are found.
+        for term in itertools.chain(
+            result.matched_title_terms, result.matched_profile_terms, result.matched_industry_terms
+        ):
+            if term in seen:
+                continue
+            seen.add(term)
+            unique.append(term)
+            if len(unique) == 3:
+                break
+        return " • ".join(unique) if unique else "-"
 
     @staticmethod
     def _join_terms_for_display(values: list[str]) -> str:
@@ -738,7 +1162,9 @@ class MainWindow(QMainWindow):
         link = record.link.strip().lower()
         if link:
             return f"link:{link}"
-        return f"fallback:{record.channel.lower()}|{record.published_at.isoformat()}|{record.text.lower()}"
+        # Hash the body instead of case-folding it; forwarded posts can be very long.
+        digest = hashlib.blake2b(record.text.encode("utf-8"), digest_size=8).hexdigest()
+        return f"fallback:{record.channel.lower()}|{record.published_at.isoformat()}|{digest}"
 
     @staticmethod
     def _build_metric_card(title: str, value: str) -> tuple[QFrame, QLabel]:
@@ -760,204 +1186,32 @@ class MainWindow(QMainWindow):
 
     @staticmethod
     def _format_eta(seconds: float) -> str:
-        total = int(max(0, round(seconds)))
-        minutes = total // 60
-        secs = total % 60
+        return MainWindow._format_eta_cached(int(max(0, round(seconds))))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _format_eta_cached(total_seconds: int) -> str:
+        # Consecutive progress ticks usually round to the same second.
+        minutes, secs = divmod(total_seconds, 60)
         return f"{minutes:02d}:{secs:02d}"
 
-    def resizeEvent(self, event) -> None:  # noqa: N802
-        super().resizeEvent(event)
-        self._refresh_left_hero_art()
+    def closeEvent(self, event) -> None:  # noqa: N802
+        thread = self._scan_thread
+        if thread is None or thread.isFinished():
+            super().closeEvent(event)
+            return
+        # Blocking here could hang on a network await, or deadlock on an open login prompt,
+        # so the window stays up until the worker notices the stop and its thread ends.
+        event.ignore()
+        self._request_stop_scan()
+        if self._prompt_dialog is not None:
+            self._prompt_dialog.reject()
+        if not self._close_after_scan:
+            self._close_after_scan = True
+            thread.finished.connect(self.close)
 
     def _apply_theme(self) -> None:
-        self.setStyleSheet(
-            """
-            QMainWindow {
-                background: #06090f;
-                color: #e8f2ff;
-            }
-            QStatusBar {
-                background: #0b1320;
-                color: #9ab5d2;
-                border-top: 1px solid #1b2a3b;
-            }
-            #LeftPanel, #RightPanel {
-                background: #0b1420;
-                border-radius: 22px;
-            }
-            #LeftHeroArt {
-                color: #7f9dbf;
-                font-size: 20px;
-                font-weight: 800;
-            }
-            #TopBar {
-                background: #121e2d;
-                border-radius: 14px;
-            }
-            #MainTitle {
-                color: #f3f9ff;
-                font-size: 28px;
-                font-weight: 800;
-            }
-            #GhostButton {
-                background: #16324d;
-                color: #d7eafc;
-                border: none;
-                border-radius: 10px;
-                padding: 8px 16px;
-                font-size: 13px;
-                font-weight: 700;
-                text-align: center;
-            }
-            #GhostButton:disabled {
-                color: #63809b;
-                background: #122436;
-            }
-            #StartButton {
-                background: #1cc587;
-                color: #042118;
-                border: none;
-                border-radius: 12px;
-                padding: 12px 16px;
-                font-size: 17px;
-                font-weight: 800;
-                text-align: center;
-            }
-            #StartButton:disabled {
-                background: #25644d;
-                color: #9fd0ba;
-            }
-            #StartButton:pressed {
-                background: #19B37D;
-                color: #021912;
-                padding-top: 14px;
-            }
-            #StopButton {
-                background: #17314a;
-                color: #d4e8fb;
-                border: none;
-                border-radius: 12px;
-                padding: 12px 16px;
-                font-size: 16px;
-                font-weight: 700;
-                text-align: center;
-            }
-            #StopButton:disabled {
-                background: #7B4856;
-                color: #E6D9DE;
-            }
-            #StopButton:pressed {
-                background: #7F4150;
-                color: #F2E7EA;
-                padding-top: 14px;
-            }
-            #HeroCounter, #HeroStatus, #MetricCard, #FeedCard, #QuickSettingsCard {
-                background: #0f1b2a;
-                border-radius: 18px;
-            }
-            #HeroCounter {
-                background: #122338;
-            }
-            #HeroTitle {
-                color: #86abd0;
-                font-size: 12px;
-                font-weight: 700;
-                letter-spacing: 0.5px;
-            }
-            #LiveCounter {
-                color: #ffffff;
-                font-weight: 900;
-            }
-            #StatusPrimary {
-                color: #ffffff;
-                font-size: 18px;
-                font-weight: 800;
-            }
-            #StatusSecondary {
-                color: #a7c2de;
-                font-size: 12px;
-                font-weight: 600;
-            }
-            #MetricTitle {
-                color: #7f9dbf;
-                font-size: 12px;
-                font-weight: 700;
-                letter-spacing: 0.4px;
-            }
-            #MetricValue {
-                color: #f3f9ff;
-                font-size: 44px;
-                font-weight: 900;
-            }
-            #QuickSettingsCard QLabel {
-                color: #c9ddf2;
-                font-size: 13px;
-                font-weight: 600;
-            }
-            #QuickSettingsCard QTextEdit, #QuickSettingsCard QSpinBox {
-                background: #0d1826;
-                color: #e6f1ff;
-                border: 1px solid #1a2b3e;
-                border-radius: 8px;
-                padding: 6px 8px;
-                font-size: 13px;
-            }
-            #QuickSettingsCard QSpinBox::up-button, #QuickSettingsCard QSpinBox::down-button {
-                width: 20px;
-            }
-            #FeedTable {
-                background: #0d1826;
-                border: 1px solid #1a2b3e;
-                border-radius: 10px;
-                gridline-color: #1c2c3f;
-                color: #e6f1ff;
-                font-size: 13px;
-            }
-            #FeedTable QHeaderView::section {
-                background: #14273b;
-                color: #8fb4d8;
-                border: none;
-                padding: 10px 8px;
-                font-size: 12px;
-                font-weight: 700;
-            }
-            #FeedTable::item {
-                padding: 8px;
-            }
-            #SortToggleButton {
-                background: #27496D;
-                color: #EAF2FF;
-                border: none;
-                border-radius: 8px;
-                font-size: 13px;
-                font-weight: 700;
-                text-align: center;
-                padding: 0 10px;
-            }
-            #SortToggleButton:hover {
-                background: #31577F;
-            }
-            #FeedBanButton {
-                background: transparent;
-                border: none;
-                color: #A9BCD3;
-                font-size: 13px;
-                font-weight: 700;
-                padding: 0;
-            }
-            #FeedBanButton:checked {
-                color: #F08DA0;
-            }
-            #FeedBanButton:hover {
-                color: #D9E5F2;
-            }
-            QToolTip {
-                background: #122338;
-                color: #f3f9ff;
-                border: 1px solid #2c4866;
-                padding: 8px 10px;
-                font-size: 14px;
-                font-weight: 400;
-            }
-            """
-        )
+        # Installed on the application once; every later window and dialog reuses the parsed sheet.
+        app = QApplication.instance()
+        if isinstance(app, QApplication) and app.styleSheet() != _STYLESHEET:
+            app.setStyleSheet(_STYLESHEET)
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import logging
+
+from PySide6.QtCore import QObject, Signal, Slot
+
+from tjr.core.scanner import StopCheck, run_scan
+from tjr.storage.config_store import AppConfig
+
+logger = logging.getLogger(__name__)
+
+
+class ScanWorker(QObject):
+    progress = Signal(object)
+    finished = Signal(object)
+    failed = Signal(object)
+    # Emitted with "code" or "password"; connect with Qt.BlockingQueuedConnection so the
+    # dialog runs on the GUI thread while the scan thread waits for the answer.
+    prompt_requested = Signal(str)
+
+    def __init__(self, config: AppConfig, should_stop: StopCheck) -> None:
+        super().__init__()
+        self._config = config
+        self._should_stop = should_stop
+        self._prompt_answer: str | None = None
+
+    def set_prompt_answer(self, value: str | None) -> None:
+        self._prompt_answer = value
+
+    @Slot()
+    def run(self) -> None:
+        try:
+            report = run_scan(
+                self._config,
+                request_code=self._request_code,
+                request_password=self._request_password,
+                progress_callback=self.progress.emit,
+                should_stop=self._should_stop,
+            )
+        except Exception as exc:  # noqa: BLE001
+            logger.exception("Chat scan failed")
+            self.failed.emit(exc)
+            return
+        self.finished.emit(report)
+
+    def _request_code(self) -> str | None:
+        return self._prompt("code")
+
+    def _request_password(self) -> str | None:
+        return self._prompt("password")
+
+    def _prompt(self, kind: str) -> str | None:
+        # After a stop there may be no window left to answer; a None answer cancels the login.
+        if self._should_stop():
+            return None
+        self._prompt_answer = None
+        self.prompt_requested.emit(kind)
+        return self._prompt_answer
@@ -7,14 +7,14 @@ from PySide6.QtWidgets import (
     QLabel,
     QLineEdit,
     QMessageBox,
+    QPlainTextEdit,
     QPushButton,
-    QTextEdit,
     QVBoxLayout,
 )
 
 from tjr.core.input_parser import parse_search_terms_text
 from tjr.storage.config_store import AppConfig, JobProfileSettings, TelegramSettings
-from tjr.ui.smooth_scroll import enable_smooth_wheel_scroll
+from tjr.ui.smooth_scroll import SmoothPlainTextEdit, register_smooth_scroll
 
 
 class SettingsDialog(QDialog):
@@ -28,34 +28,33 @@ class SettingsDialog(QDialog):
 
         form = QFormLayout()
 
-        self.api_id_input = QLineEdit(config.telegram.api_id)
+        self.api_id_input = QLineEdit()
         self.api_id_input.setPlaceholderText("Telegram API ID")
         form.addRow("Telegram API ID", self.api_id_input)
 
-        self.api_hash_input = QLineEdit(config.telegram.api_hash)
+        self.api_hash_input = QLineEdit()
         self.api_hash_input.setEchoMode(QLineEdit.Password)
         self.api_hash_input.setPlaceholderText("Telegram API Hash")
         form.addRow("Telegram API Hash", self.api_hash_input)
 
-        self.phone_input = QLineEdit(config.telegram.phone_number)
+        self.phone_input = QLineEdit()
         self.phone_input.setPlaceholderText("+79990001122")
         form.addRow("Телефон Telegram", self.phone_input)
 
-        self.profile_input = QTextEdit(self._join_terms_for_display(config.job_profile.profile_keywords))
+        self.profile_input = SmoothPlainTextEdit()
         self.profile_input.setPlaceholderText(
             "Ключевые слова профиля через /, запятую или новую строку"
         )
         self.profile_input.setMinimumHeight(90)
-        enable_smooth_wheel_scroll(self.profile_input, speed_factor=0.68, duration_ms=110)
         form.addRow(QLabel("Совпадение по профилю"), self.profile_input)
 
-        self.industry_input = QTextEdit(self._join_terms_for_display(config.job_profile.industry_keywords))
+        self.industry_input = SmoothPlainTextEdit()
         self.industry_input.setPlaceholderText(
             "Ключевые слова отрасли через /, запятую или новую строку"
         )
         self.industry_input.setMinimumHeight(90)
-        enable_smooth_wheel_scroll(self.industry_input, speed_factor=0.68, duration_ms=110)
         form.addRow(QLabel("Совпадение по отрасли"), self.industry_input)
+        register_smooth_scroll(self, (self.profile_input, self.industry_input), speed_factor=0.68, duration_ms=110)
 
         info_label = QLabel(
             "Каналы/чаты, совпадение по названию, глубина и исключения теперь редактируются на главном экране."
@@ -77,6 +76,19 @@ class SettingsDialog(QDialog):
         buttons.addWidget(save_button)
 
         root.addLayout(buttons)
+        self.reload(config)
+
+    def reload(self, config: AppConfig) -> None:
+        # The window keeps one dialog; reopening only refills the fields from the current config.
+        self._config = config
+        self.api_id_input.setText(config.telegram.api_id)
+        self.api_hash_input.setText(config.telegram.api_hash)
+        self.phone_input.setText(config.telegram.phone_number)
+        # Snapshot of what was shown, so untouched fields keep their parsed lists on save.
+        self._initial_profile_text = self._join_terms_for_display(config.job_profile.profile_keywords)
+        self._initial_industry_text = self._join_terms_for_display(config.job_profile.industry_keywords)
+        self._set_plain_text(self.profile_input, self._initial_profile_text)
+        self._set_plain_text(self.industry_input, self._initial_industry_text)
 
     @property
     def config(self) -> AppConfig:
@@ -87,23 +99,46 @@ class SettingsDialog(QDialog):
         api_hash = self.api_hash_input.text().strip()
         phone_number = self.phone_input.text().strip()
 
-        if (api_id and not api_id.isdigit()) or (api_hash and len(api_hash) < 8):
-            QMessageBox.warning(self, "Ошибка валидации", "Проверьте Telegram API ID/API Hash.")
+        errors = _validation_errors(api_id, api_hash, phone_number)
+        if errors:
+            # One report for every problem, so a second mistake does not need another save attempt.
+            QMessageBox.warning(self, "Ошибка валидации", "\n".join(errors))
             return
 
-        if phone_number and not phone_number.startswith("+"):
-            QMessageBox.warning(self, "Ошибка валидации", "Номер Telegram укажите в формате +79990001122.")
+        profile = self._config.job_profile
+        profile_text = self.profile_input.toPlainText()
+        industry_text = self.industry_input.toPlainText()
+        profile_keywords = (
+            profile.profile_keywords
+            if profile_text == self._initial_profile_text
+            else parse_search_terms_text(profile_text)
+        )
+        industry_keywords = (
+            profile.industry_keywords
+            if industry_text == self._initial_industry_text
+            else parse_search_terms_text(industry_text)
+        )
+
+        telegram = self._config.telegram
+        if (
+            (api_id, api_hash, phone_number) == (telegram.api_id, telegram.api_hash, telegram.phone_number)
+            and profile_keywords == profile.profile_keywords
+            and industry_keywords == profile.industry_keywords
+        ):
+            # Nothing edited: keep the same config object so the caller can skip saving it.
+            self.accept()
             return
 
         updated = AppConfig(
             telegram=TelegramSettings(api_id=api_id, api_hash=api_hash, phone_number=phone_number),
             selected_chats=self._config.selected_chats,
             job_profile=JobProfileSettings(
-                title_keywords=self._config.job_profile.title_keywords,
-                profile_keywords=parse_search_terms_text(self.profile_input.toPlainText()),
-                industry_keywords=parse_search_terms_text(self.industry_input.toPlainText()),
-                exclusion_phrases=self._config.job_profile.exclusion_phrases,
-                min_match_score=self._config.job_profile.min_match_score,
+                title_keywords=profile.title_keywords,
+                profile_keywords=profile_keywords,
+                industry_keywords=industry_keywords,
+                exclusion_phrases=profile.exclusion_phrases,
+                min_match_score=profile.min_match_score,
+                max_message_tokens=profile.max_message_tokens,
             ),
             scan_depth_days=self._config.scan_depth_days,
             banned_message_links=self._config.banned_message_links,
@@ -112,6 +147,21 @@ class SettingsDialog(QDialog):
         self._config = updated
         self.accept()
 
+    @staticmethod
+    def _set_plain_text(editor: QPlainTextEdit, text: str) -> None:
+        # A reopened dialog usually shows the same terms; skip the document re-layout then.
+        if editor.toPlainText() != text:
+            editor.setPlainText(text)
+
     @staticmethod
     def _join_terms_for_display(values: list[str]) -> str:
         return " / ".join(values)
+
+
+def _validation_errors(api_id: str, api_hash: str, phone_number: str) -> list[str]:
+    errors: list[str] = []
+    if (api_id and not api_id.isdigit()) or (api_hash and len(api_hash) < 8):
+        errors.append("Проверьте Telegram API ID/API Hash.")
+    if phone_number and not phone_number.startswith("+"):
+        errors.append("Номер Telegram укажите в формате +79990001122.")
+    return errors
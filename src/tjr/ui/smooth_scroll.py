@@ -1,128 +1,177 @@
 from __future__ import annotations
 
-from PySide6.QtCore import QEasingCurve, QEvent, QObject, QPropertyAnimation, Qt
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import cast
+
+from PySide6.QtCore import QEvent, QObject, Qt, QTimer
 from PySide6.QtGui import QWheelEvent
-from PySide6.QtWidgets import QAbstractScrollArea, QScrollBar
+from PySide6.QtWidgets import QAbstractScrollArea, QPlainTextEdit, QScrollBar
+
+# One 120-unit wheel notch scrolls ten single steps.
+_ANGLE_STEP_SCALE = 10 / 120.0
+_FRAME_MS = 16
+# Share of the distance still left when duration_ms has elapsed.
+_SETTLE_RESIDUE = 0.05
+
+
+@dataclass(slots=True, eq=False)
+class _AxisScroll:
+    bar: QScrollBar
+    position: float = 0.0
+    target: float = 0.0
+
+
+@dataclass(slots=True)
+class _AreaScroll:
+    vertical: _AxisScroll
+    horizontal: _AxisScroll
+    # Set for QPlainTextEdit, whose vertical scrollbar counts lines rather than pixels.
+    line_area: QPlainTextEdit | None = None
 
 
-class SmoothWheelScroller(QObject):
+class SharedSmoothWheelScroller(QObject):
+    # One filter and one frame timer for several scroll areas; each axis eases toward its own target.
     def __init__(
         self,
-        area: QAbstractScrollArea,
+        owner: QObject,
         speed_factor: float = 0.35,
         duration_ms: int = 180,
     ) -> None:
-        super().__init__(area)
-        self._area = area
+        super().__init__(owner)
         self._speed_factor = max(0.05, speed_factor)
-        self._duration_ms = max(80, duration_ms)
-        self._v_remainder = 0.0
-        self._h_remainder = 0.0
-        self._v_anim = self._build_animation(self._area.verticalScrollBar())
-        self._h_anim = self._build_animation(self._area.horizontalScrollBar())
-
-        self._area.viewport().installEventFilter(self)
+        duration_ms = max(80, duration_ms)
+        # Fraction of the remaining gap closed per frame, so motion settles in about duration_ms.
+        self._ease = 1.0 - _SETTLE_RESIDUE ** (_FRAME_MS / duration_ms)
+        self._areas: dict[QObject, _AreaScroll] = {}
+        self._moving: set[_AxisScroll] = set()
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.setInterval(_FRAME_MS)
+        self._timer.timeout.connect(self._tick)
+
+    def add_area(self, area: QAbstractScrollArea) -> None:
+        viewport = area.viewport()
+        if viewport in self._areas:
+            return
+        state = _AreaScroll(
+            _AxisScroll(area.verticalScrollBar()),
+            _AxisScroll(area.horizontalScrollBar()),
+            area if isinstance(area, QPlainTextEdit) else None,
+        )
+        self._areas[viewport] = state
+        if isinstance(area, SmoothPlainTextEdit):
+            # Only wheel events reach its override; a viewport filter would run for every paint and mouse move.
+            area.set_smooth_scroller(self)
+        else:
+            viewport.installEventFilter(self)
 
-    def _build_animation(self, scrollbar: QScrollBar) -> QPropertyAnimation:
-        animation = QPropertyAnimation(scrollbar, b"value", self)
-        animation.setEasingCurve(QEasingCurve.Type.OutCubic)
-        animation.setDuration(self._duration_ms)
-        return animation
+    def handle_wheel(self, area: QAbstractScrollArea, event: QWheelEvent) -> bool:
+        return self._handle_viewport_wheel(area.viewport(), event)
 
     def eventFilter(self, watched: QObject, event: QEvent) -> bool:
-        if event.type() != QEvent.Type.Wheel:
-            return super().eventFilter(watched, event)
-
-        wheel_event = event
-        if not isinstance(wheel_event, QWheelEvent):
-            return super().eventFilter(watched, event)
-
-        if wheel_event.modifiers() & Qt.KeyboardModifier.ControlModifier:
-            return super().eventFilter(watched, event)
-
-        if self._handle_wheel(wheel_event):
-            wheel_event.accept()
+        # Wheel-typed events always arrive as QWheelEvent, so no isinstance check is needed.
+        if event.type() == QEvent.Type.Wheel and self._handle_viewport_wheel(watched, cast(QWheelEvent, event)):
             return True
         return super().eventFilter(watched, event)
 
-    def _handle_wheel(self, event: QWheelEvent) -> bool:
+    def _handle_viewport_wheel(self, viewport: QObject, event: QWheelEvent) -> bool:
+        if event.modifiers() & Qt.KeyboardModifier.ControlModifier:
+            return False
+        state = self._areas.get(viewport)
+        if state is None or not self._handle_wheel(state, event):
+            return False
+        event.accept()
+        return True
+
+    def _handle_wheel(self, state: _AreaScroll, event: QWheelEvent) -> bool:
+        # Each delta is read once; the larger component picks the axis (ties go to vertical).
         pixel_delta = event.pixelDelta()
-        angle_delta = event.angleDelta()
+        x = pixel_delta.x()
+        y = pixel_delta.y()
+        if x or y:
+            if abs(y) >= abs(x):
+                line_area = state.line_area
+                if line_area is not None:
+                    # Trackpad deltas are pixels; convert them to the line units of this scrollbar.
+                    return self._scroll_axis(state.vertical, y / max(1, line_area.fontMetrics().lineSpacing()))
+                return self._scroll_axis(state.vertical, y)
+            return self._scroll_axis(state.horizontal, x)
 
-        if abs(pixel_delta.y()) >= abs(pixel_delta.x()) and pixel_delta.y() != 0:
-            return self._scroll_axis(
-                self._area.verticalScrollBar(),
-                self._v_anim,
-                pixel_delta.y(),
-                vertical=True,
-            )
-        if abs(pixel_delta.x()) > abs(pixel_delta.y()) and pixel_delta.x() != 0:
-            return self._scroll_axis(
-                self._area.horizontalScrollBar(),
-                self._h_anim,
-                pixel_delta.x(),
-                vertical=False,
-            )
-
-        if abs(angle_delta.y()) >= abs(angle_delta.x()) and angle_delta.y() != 0:
-            units = (angle_delta.y() / 120.0) * self._area.verticalScrollBar().singleStep() * 10
-            return self._scroll_axis(
-                self._area.verticalScrollBar(),
-                self._v_anim,
-                units,
-                vertical=True,
-            )
-        if abs(angle_delta.x()) > abs(angle_delta.y()) and angle_delta.x() != 0:
-            units = (angle_delta.x() / 120.0) * self._area.horizontalScrollBar().singleStep() * 10
-            return self._scroll_axis(
-                self._area.horizontalScrollBar(),
-                self._h_anim,
-                units,
-                vertical=False,
-            )
+        angle_delta = event.angleDelta()
+        x = angle_delta.x()
+        y = angle_delta.y()
+        if x or y:
+            if abs(y) >= abs(x):
+                axis = state.vertical
+                return self._scroll_axis(axis, y * axis.bar.singleStep() * _ANGLE_STEP_SCALE)
+            axis = state.horizontal
+            return self._scroll_axis(axis, x * axis.bar.singleStep() * _ANGLE_STEP_SCALE)
 
         return False
 
-    def _scroll_axis(
-        self,
-        scrollbar: QScrollBar,
-        animation: QPropertyAnimation,
-        delta: float,
-        *,
-        vertical: bool,
-    ) -> bool:
-        if scrollbar.maximum() <= scrollbar.minimum():
+    def _scroll_axis(self, axis: _AxisScroll, delta: float) -> bool:
+        scrollbar = axis.bar
+        # Range is read once per event; caching it behind rangeChanged would run a slot on every
+        # content change of the area, which happens far more often than wheel input.
+        minimum = scrollbar.minimum()
+        maximum = scrollbar.maximum()
+        if maximum <= minimum:
             return False
 
-        remainder = self._v_remainder if vertical else self._h_remainder
-        scaled_delta = (delta * self._speed_factor) + remainder
-        whole = int(scaled_delta)
-        remainder = scaled_delta - whole
-        if vertical:
-            self._v_remainder = remainder
-        else:
-            self._h_remainder = remainder
-
-        if animation.state() == QPropertyAnimation.State.Running:
-            current = int(animation.currentValue())
-            animation.stop()
-            scrollbar.setValue(current)
-        else:
-            current = scrollbar.value()
-
-        if whole == 0:
-            return True
+        if axis not in self._moving and round(axis.position) != scrollbar.value():
+            # Something else moved the scrollbar (drag, keys, content change); restart from there.
+            axis.position = axis.target = float(scrollbar.value())
 
-        target = current - whole
-        target = max(scrollbar.minimum(), min(target, scrollbar.maximum()))
-        if target == current:
+        # Positions stay fractional, so sub-pixel deltas add up without a separate remainder;
+        # ticks that land mid-motion extend the pending target instead of restarting the easing.
+        target = max(minimum, min(axis.target - delta * self._speed_factor, maximum))
+        if target == axis.target:
             return True
 
-        animation.setStartValue(current)
-        animation.setEndValue(target)
-        animation.start()
+        axis.target = target
+        self._moving.add(axis)
+        if not self._timer.isActive():
+            self._timer.start()
         return True
 
+    def _tick(self) -> None:
+        ease = self._ease
+        for axis in tuple(self._moving):
+            gap = axis.target - axis.position
+            if -1.0 < gap < 1.0:
+                axis.position = axis.target
+                self._moving.discard(axis)
+            else:
+                axis.position += gap * ease
+            axis.bar.setValue(round(axis.position))
+        if not self._moving:
+            self._timer.stop()
+
+
+class SmoothPlainTextEdit(QPlainTextEdit):
+    _smooth_scroller: SharedSmoothWheelScroller | None = None
+
+    def set_smooth_scroller(self, scroller: SharedSmoothWheelScroller | None) -> None:
+        self._smooth_scroller = scroller
+
+    def wheelEvent(self, event: QWheelEvent) -> None:  # noqa: N802
+        scroller = self._smooth_scroller
+        if scroller is not None and scroller.handle_wheel(self, event):
+            return
+        super().wheelEvent(event)
+
+
+class SmoothWheelScroller(SharedSmoothWheelScroller):
+    def __init__(
+        self,
+        area: QAbstractScrollArea,
+        speed_factor: float = 0.35,
+        duration_ms: int = 180,
+    ) -> None:
+        super().__init__(area, speed_factor=speed_factor, duration_ms=duration_ms)
+        self.add_area(area)
+
 
 def enable_smooth_wheel_scroll(
     area: QAbstractScrollArea,
@@ -132,3 +181,16 @@ def enable_smooth_wheel_scroll(
     scroller = SmoothWheelScroller(area=area, speed_factor=speed_factor, duration_ms=duration_ms)
     setattr(area, "_smooth_wheel_scroller", scroller)
     return scroller
+
+
+def register_smooth_scroll(
+    owner: QObject,
+    areas: Iterable[QAbstractScrollArea],
+    speed_factor: float = 0.35,
+    duration_ms: int = 180,
+) -> SharedSmoothWheelScroller:
+    scroller = SharedSmoothWheelScroller(owner, speed_factor=speed_factor, duration_ms=duration_ms)
+    for area in areas:
+        scroller.add_area(area)
+        setattr(area, "_smooth_wheel_scroller", scroller)
+    return scroller
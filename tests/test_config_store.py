@@ -1,7 +1,10 @@
 import tempfile
 import unittest
+from dataclasses import asdict
 from pathlib import Path
+from unittest import mock
 
+from tjr.storage import config_store
 from tjr.storage.config_store import AppConfig, ConfigStore, JobProfileSettings, TelegramSettings
 
 
@@ -36,6 +39,103 @@ class ConfigStoreTests(unittest.TestCase):
             self.assertEqual(loaded.scan_depth_days, 45)
             self.assertEqual(loaded.banned_message_links, ["https://t.me/SomeChannel/123"])
 
+    def test_config_store_roundtrip_without_orjson(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir, mock.patch.object(config_store, "orjson", None):
+            store = ConfigStore(config_path=Path(tmp_dir) / "config.json")
+            store.save(AppConfig(selected_chats=["@jobs"], scan_depth_days=30))
+
+            loaded = store.load()
+
+            self.assertEqual(loaded.selected_chats, ["@jobs"])
+            self.assertEqual(loaded.scan_depth_days, 30)
+
+    def test_config_store_load_reuses_cache_until_file_changes(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "config.json"
+            store = ConfigStore(config_path=path)
+            store.save(AppConfig(selected_chats=["@jobs"]))
+
+            first = store.load()
+            first.selected_chats.append("@mutated")
+            second = store.load()
+            path.write_text('{"selected_chats": ["@other", "@more"]}', encoding="utf-8")
+            third = store.load()
+
+            self.assertEqual(second.selected_chats, ["@jobs"])
+            self.assertEqual(third.selected_chats, ["@other", "@more"])
+
+    def test_config_store_payload_matches_dataclass_fields(self) -> None:
+        config = AppConfig(job_profile=JobProfileSettings(title_keywords=["директор"]))
+
+        self.assertEqual(ConfigStore._to_dict(config), asdict(config))
+
+    def test_config_store_save_replaces_file_without_leftovers(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "nested" / "config.json"
+            store = ConfigStore(config_path=path)
+            store.save(AppConfig(scan_depth_days=10))
+            store.save(AppConfig(scan_depth_days=20))
+
+            self.assertEqual(sorted(p.name for p in path.parent.iterdir()), ["config.json"])
+            self.assertEqual(ConfigStore(config_path=path).load().scan_depth_days, 20)
+
+    def test_config_store_clamps_numeric_settings(self) -> None:
+        self.assertEqual([ConfigStore._normalize_score(v) for v in (0, 2, 9, "x")], [1, 2, 3, 2])
+        self.assertEqual([ConfigStore._normalize_days(v) for v in (-5, 45, 1000, None)], [1, 45, 365, 14])
+
+    def test_config_store_tolerates_malformed_sections(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "config.json"
+            path.write_text('{"telegram": null, "job_profile": [], "scan_depth_days": 7}', encoding="utf-8")
+            loaded = ConfigStore(config_path=path).load()
+            path.write_text("[1, 2]", encoding="utf-8")
+            fallback = ConfigStore(config_path=path).load()
+
+            self.assertEqual(loaded.scan_depth_days, 7)
+            self.assertEqual(loaded.telegram.api_id, "")
+            self.assertEqual(fallback.scan_depth_days, 14)
+
+    def test_config_store_dedupes_lists_in_order(self) -> None:
+        normalized = ConfigStore._normalize_list([" Python ", "go", "python", "", 7, "Go"], lowercase=True)
+
+        self.assertEqual(normalized, ["python", "go", "7"])
+        self.assertEqual(ConfigStore._normalize_list(("@a", "@b"), lowercase=False), ["@a", "@b"])
+        self.assertEqual(ConfigStore._normalize_list(iter(["@a"]), lowercase=False), ["@a"])
+        self.assertEqual(ConfigStore._normalize_list("@a", lowercase=False), [])
+        self.assertEqual(ConfigStore._normalize_list(5, lowercase=False), [])
+
+    def test_ensure_exists_writes_default_config_once(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "nested" / "config.json"
+            store = ConfigStore(config_path=path)
+            store.ensure_exists()
+            written = path.read_bytes()
+            store.ensure_exists()
+
+            self.assertEqual(path.read_bytes(), written)
+            self.assertEqual(ConfigStore(config_path=path).load(), AppConfig())
+
+    def test_app_config_copy_is_independent(self) -> None:
+        config = AppConfig(selected_chats=["@jobs"], job_profile=JobProfileSettings(title_keywords=["директор"]))
+        snapshot = config.copy()
+        snapshot.selected_chats.append("@other")
+        snapshot.job_profile.title_keywords.append("менеджер")
+        snapshot.telegram.api_id = "1"
+
+        self.assertEqual(config.selected_chats, ["@jobs"])
+        self.assertEqual(config.job_profile.title_keywords, ["директор"])
+        self.assertEqual(config.telegram.api_id, "")
+
+    def test_config_store_loads_large_config(self) -> None:
+        keywords = [f"keyword {index}" for index in range(2000)]
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "config.json"
+            ConfigStore(config_path=path).save(AppConfig(job_profile=JobProfileSettings(title_keywords=keywords)))
+
+            loaded = ConfigStore(config_path=path).load()
+
+            self.assertEqual(loaded.job_profile.title_keywords, keywords)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -33,6 +33,10 @@ class InputParserTests(unittest.TestCase):
         values = parse_chat_sources_list(["@rudakovahr", "https://t.me/rudakovahr/7378"])
         self.assertEqual(values, ["@rudakovahr", "https://t.me/rudakovahr/7378"])
 
+    def test_parse_chat_sources_list_dedupes_uppercase_links(self) -> None:
+        values = parse_chat_sources_list(["HTTPS://T.ME/RudakovaHR", "@rudakovahr", "httpchannel"])
+        self.assertEqual(values, ["HTTPS://T.ME/RudakovaHR", "httpchannel"])
+
     def test_parse_search_terms_text_supports_slash_separator(self) -> None:
         values = parse_search_terms_text("ceo/исполнительный директор/операционный директор")
         self.assertEqual(values, ["ceo", "исполнительный директор", "операционный директор"])
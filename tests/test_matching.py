@@ -112,6 +112,25 @@ class MatchingTests(unittest.TestCase):
         self.assertFalse(result.excluded)
         self.assertGreaterEqual(result.score, 1)
 
+    def test_evaluate_message_fast_exclude_skips_criteria(self) -> None:
+        profile = JobProfileSettings(title_keywords=["директор"], exclusion_phrases=["стажировка"], min_match_score=1)
+
+        result = evaluate_message("Стажировка для директоров продаж.", profile, fast_exclude=True)
+
+        self.assertTrue(result.excluded)
+        self.assertEqual(result.score, 0)
+        self.assertEqual(result.matched_title_terms, [])
+        self.assertEqual(result.matched_exclusion_terms, ["стажировка"])
+        self.assertEqual(result.active_criteria_count, 1)
+
+    def test_evaluate_message_ignores_tokens_past_limit(self) -> None:
+        profile = JobProfileSettings(title_keywords=["директор"], min_match_score=1, max_message_tokens=50)
+        text = "слово " * 60 + "Ищем директора."
+
+        self.assertEqual(evaluate_message(text, profile).score, 0)
+        profile.max_message_tokens = 2000
+        self.assertEqual(evaluate_message(text, profile).score, 1)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,8 +1,17 @@
+import asyncio
 import unittest
-from datetime import datetime
-
-from tjr.core.matching import MatchResult
-from tjr.core.scanner import MatchRecord, ScanProgress, _dedupe_match_records, run_scan
+from datetime import datetime, timedelta
+from unittest import mock
+
+from tjr.core.scanner import (
+    ChatMessage,
+    ScanProgress,
+    _match_record_key,
+    _parse_source,
+    _progress_rate_limiter,
+    _resolve_source_entity,
+    run_scan,
+)
 from tjr.storage.config_store import AppConfig, JobProfileSettings
 
 
@@ -44,37 +53,45 @@ class ScannerTests(unittest.TestCase):
         self.assertEqual(report.scanned_messages, 3)
         self.assertEqual(len(report.matched_records), 0)
 
-    def test_dedupe_match_records_by_link(self) -> None:
-        result = MatchResult(
-            score=1,
-            active_criteria_count=1,
-            excluded=False,
-            matched_title=True,
-            matched_profile=False,
-            matched_industry=False,
-            matched_title_terms=["директор"],
-            matched_profile_terms=[],
-            matched_industry_terms=[],
-            matched_exclusion_terms=[],
+    def test_run_scan_drops_matches_sharing_a_link(self) -> None:
+        config = AppConfig(
+            selected_chats=["@jobs"],
+            job_profile=JobProfileSettings(title_keywords=["директор"], min_match_score=1),
         )
-        first = MatchRecord(
-            channel="@rudakovahr",
-            published_at=datetime(2026, 2, 13, 10, 0, 0),
-            text="Директор по продукту",
-            link="https://t.me/rudakovahr/7378",
-            match_result=result,
+        now = datetime.now()
+        messages = {
+            "@jobs": [
+                ChatMessage("@jobs", now - timedelta(minutes=2), "Ищем директора.", "https://t.me/jobs/7"),
+                ChatMessage("@jobs", now - timedelta(minutes=1), "Ищем директора (дубль).", "https://t.me/JOBS/7"),
+            ]
+        }
+
+        with mock.patch("tjr.core.scanner._build_demo_messages", return_value=messages):
+            report = run_scan(config)
+
+        self.assertEqual(report.scanned_messages, 2)
+        self.assertEqual([record.link for record in report.matched_records], ["https://t.me/jobs/7"])
+
+    def test_match_record_key_prefers_link(self) -> None:
+        first = _match_record_key(
+            "https://t.me/rudakovahr/7378", "@rudakovahr", datetime(2026, 2, 13, 10, 0, 0), "Директор"
         )
-        second = MatchRecord(
-            channel="@rudakovahr",
-            published_at=datetime(2026, 2, 13, 10, 0, 1),
-            text="Директор по продукту (дубль)",
-            link="https://t.me/rudakovahr/7378",
-            match_result=result,
+        second = _match_record_key(
+            "https://t.me/rudakovahr/7378", "@rudakovahr", datetime(2026, 2, 13, 10, 0, 1), "Директор (дубль)"
         )
+        unlinked = _match_record_key("", "@RudakovaHR", datetime(2026, 2, 13, 10, 0, 0), " Директор ")
+
+        self.assertEqual(first, second)
+        self.assertEqual(unlinked, "text:@rudakovahr|2026-02-13T10:00:00|директор")
+
+    def test_parse_source_handles_public_and_private_message_links(self) -> None:
+        public = _parse_source("https://t.me/rudakovahr/7378")
+        private = _parse_source("HTTPS://t.me/c/123456/42/")
+        chat = _parse_source("https://t.me/c/42")
 
-        deduped = _dedupe_match_records([first, second])
-        self.assertEqual(len(deduped), 1)
-        self.assertEqual(deduped[0].link, "https://t.me/rudakovahr/7378")
+        self.assertEqual((public.chat_ref, public.message_id), ("rudakovahr", 7378))
+        self.assertEqual((private.chat_ref, private.message_id), (-100123456, 42))
+        self.assertEqual((chat.chat_ref, chat.message_id), ("c", 42))
 
     def test_run_scan_emits_progress_callback(self) -> None:
         events: list[ScanProgress] = []
@@ -96,6 +113,11 @@ class ScannerTests(unittest.TestCase):
         self.assertGreaterEqual(events[-1].scanned_messages, 1)
         self.assertGreaterEqual(events[-1].matched_count, 1)
 
+    def test_progress_rate_limiter_passes_one_tick_per_interval(self) -> None:
+        with mock.patch("tjr.core.scanner.time.monotonic", side_effect=[10.0, 10.05, 10.2, 10.25]):
+            due = _progress_rate_limiter()
+            self.assertEqual([due() for _ in range(4)], [True, False, True, False])
+
     def test_run_scan_can_be_stopped(self) -> None:
         config = AppConfig(
             selected_chats=["@jobs", "@jobs2"],
@@ -117,5 +139,18 @@ class ScannerTests(unittest.TestCase):
         self.assertTrue(report.canceled)
         self.assertLessEqual(report.scanned_chats, 1)
 
+    def test_resolve_source_entity_skips_lookup_after_stop(self) -> None:
+        client = mock.Mock()
+        client.get_entity = mock.AsyncMock()
+        source = _parse_source("@jobs")
+
+        entity, name = asyncio.run(
+            _resolve_source_entity(client, source, asyncio.Semaphore(1), should_stop=lambda: True)
+        )
+
+        self.assertIsNone(entity)
+        self.assertEqual(name, "@jobs")
+        client.get_entity.assert_not_called()
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,14 +1,29 @@
+import os
+import tempfile
+import time
 import unittest
 from datetime import datetime
+from pathlib import Path
+from unittest import mock
 
-from PySide6.QtWidgets import QApplication, QCheckBox
+# Headless by default: the offscreen plugin skips the window-system handshake on CI.
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+try:
+    import PySide6  # noqa: F401
+except ImportError as exc:
+    raise unittest.SkipTest("PySide6 is not installed") from exc
+
+from PySide6.QtCore import QEvent, QPoint, QPointF, Qt
+from PySide6.QtGui import QWheelEvent
+from PySide6.QtWidgets import QApplication, QWidget
 
 from tjr.core.matching import MatchResult
 from tjr.core.scanner import MatchRecord, ScanProgress
 from tjr.storage.config_store import AppConfig, JobProfileSettings, TelegramSettings
 from tjr.ui.main_window import MainWindow
-from tjr.ui.results_window import MatchResultsDialog
-from tjr.ui.settings_dialog import SettingsDialog
+from tjr.ui.results_window import MatchResultsDialog, XlsxExportRunnable, _highlight_text
+from tjr.ui.settings_dialog import SettingsDialog, _validation_errors
 
 
 def _ensure_app() -> QApplication:
@@ -18,6 +33,44 @@ def _ensure_app() -> QApplication:
     return app
 
 
+def _dispose(widget: QWidget) -> None:
+    # Delete the Qt side now. Left to Python's cycle collector, a window can be freed in the middle
+    # of a later test's processEvents() while Qt still calls Python event filters on its children.
+    widget.close()
+    widget.deleteLater()
+    QApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+
+
+class _DummyConfigStore:
+    def save(self, _config: AppConfig) -> None:
+        return
+
+
+# Read-only in every test, so all records share one instance.
+_TITLE_MATCH = MatchResult(
+    score=1,
+    active_criteria_count=1,
+    excluded=False,
+    matched_title=True,
+    matched_profile=False,
+    matched_industry=False,
+    matched_title_terms=["директор"],
+    matched_profile_terms=[],
+    matched_industry_terms=[],
+    matched_exclusion_terms=[],
+)
+
+
+def _record(channel: str, published_at: datetime, text: str, link: str) -> MatchRecord:
+    return MatchRecord(
+        channel=channel,
+        published_at=published_at,
+        text=text,
+        link=link,
+        match_result=_TITLE_MATCH,
+    )
+
+
 class SettingsDialogSmokeTests(unittest.TestCase):
     @classmethod
     def setUpClass(cls) -> None:
@@ -36,6 +89,7 @@ class SettingsDialogSmokeTests(unittest.TestCase):
             ),
         )
         dialog = SettingsDialog(config=config)
+        self.addCleanup(_dispose, dialog)
 
         self.assertEqual(dialog.api_id_input.text(), "12345")
         self.assertEqual(dialog.api_hash_input.text(), "secret_hash")
@@ -45,8 +99,6 @@ class SettingsDialogSmokeTests(unittest.TestCase):
         self.assertTrue(hasattr(dialog.profile_input, "_smooth_wheel_scroller"))
         self.assertTrue(hasattr(dialog.industry_input, "_smooth_wheel_scroller"))
 
-        dialog.close()
-
     def test_settings_dialog_save_updates_config(self) -> None:
         dialog = SettingsDialog(
             config=AppConfig(
@@ -59,6 +111,7 @@ class SettingsDialogSmokeTests(unittest.TestCase):
                 scan_depth_days=45,
             )
         )
+        self.addCleanup(_dispose, dialog)
         dialog.api_id_input.setText("54321")
         dialog.api_hash_input.setText("myhash123")
         dialog.phone_input.setText("+79991112233")
@@ -81,22 +134,159 @@ class SettingsDialogSmokeTests(unittest.TestCase):
         self.assertEqual(dialog.config.job_profile.min_match_score, 1)
         self.assertEqual(dialog.config.scan_depth_days, 45)
 
-        dialog.close()
-
     def test_settings_dialog_keeps_slash_style_on_reopen(self) -> None:
-        first_dialog = SettingsDialog(config=AppConfig())
-        first_dialog.profile_input.setPlainText("go/системный анализ/product")
-        first_dialog._handle_save()
-        self.assertEqual(first_dialog.result(), SettingsDialog.DialogCode.Accepted)
+        # One dialog for every field: reopening goes through reload(), as in the main window.
+        dialog = SettingsDialog(config=AppConfig())
+        self.addCleanup(_dispose, dialog)
+        cases = (
+            ("profile_input", "go/системный анализ/product", "go / системный анализ / product"),
+            ("industry_input", "fintech,банки\nритейл", "fintech / банки / ритейл"),
+        )
+        for field, text, expected in cases:
+            with self.subTest(field=field):
+                dialog.reload(AppConfig())
+                getattr(dialog, field).setPlainText(text)
+                dialog._handle_save()
+                self.assertEqual(dialog.result(), SettingsDialog.DialogCode.Accepted)
+
+                dialog.reload(dialog.config)
+                self.assertEqual(getattr(dialog, field).toPlainText(), expected)
+
+    def test_settings_dialog_shares_one_smooth_scroller(self) -> None:
+        dialog = SettingsDialog(
+            config=AppConfig(job_profile=JobProfileSettings(profile_keywords=[f"term {i}" for i in range(200)]))
+        )
+        self.addCleanup(_dispose, dialog)
+        dialog.show()
+        self._app.processEvents()
+
+        scroller = dialog.profile_input._smooth_wheel_scroller
+        self.assertIs(dialog.industry_input._smooth_wheel_scroller, scroller)
+        self.assertIs(dialog.profile_input._smooth_scroller, scroller)
+
+        viewport = dialog.profile_input.viewport()
+        center = QPointF(viewport.rect().center())
+        wheel = QWheelEvent(
+            center,
+            viewport.mapToGlobal(center),
+            QPoint(),
+            QPoint(0, -120),
+            Qt.NoButton,
+            Qt.NoModifier,
+            Qt.ScrollUpdate,
+            False,
+        )
+        scrollbar = dialog.profile_input.verticalScrollBar()
+        self.assertEqual(scrollbar.value(), 0)
+        QApplication.sendEvent(viewport, wheel)
+        self.assertTrue(scroller._timer.isActive())
+
+        # Sleep between polls so the frame timer gets to fire instead of spinning on processEvents().
+        for _ in range(200):
+            if not scroller._timer.isActive():
+                break
+            time.sleep(0.01)
+            self._app.processEvents()
+        self.assertFalse(scroller._timer.isActive())
+        self.assertGreater(scrollbar.value(), 0)
+
+    def test_smooth_plain_text_edit_converts_pixel_deltas_to_lines(self) -> None:
+        dialog = SettingsDialog(
+            config=AppConfig(job_profile=JobProfileSettings(profile_keywords=[f"term {i}" for i in range(200)]))
+        )
+        self.addCleanup(_dispose, dialog)
+        dialog.show()
+        self._app.processEvents()
+
+        editor = dialog.profile_input
+        scroller = editor._smooth_wheel_scroller
+        viewport = editor.viewport()
+        center = QPointF(viewport.rect().center())
+        # Trackpads report both deltas; the pixel one wins and must be read as pixels, not lines.
+        wheel = QWheelEvent(
+            center,
+            viewport.mapToGlobal(center),
+            QPoint(0, -50),
+            QPoint(0, -120),
+            Qt.NoButton,
+            Qt.NoModifier,
+            Qt.ScrollUpdate,
+            False,
+        )
+        QApplication.sendEvent(viewport, wheel)
+        for _ in range(200):
+            if not scroller._timer.isActive():
+                break
+            time.sleep(0.01)
+            self._app.processEvents()
+
+        line_spacing = editor.fontMetrics().lineSpacing()
+        self.assertEqual(editor.verticalScrollBar().value(), round(50 / line_spacing * 0.68))
+
+    def test_settings_dialog_keeps_untouched_keyword_lists(self) -> None:
+        config = AppConfig(job_profile=JobProfileSettings(profile_keywords=["c/c++"], industry_keywords=["fintech"]))
+        dialog = SettingsDialog(config=config)
+        self.addCleanup(_dispose, dialog)
+        dialog.industry_input.setPlainText("banking, retail")
+
+        dialog._handle_save()
+
+        self.assertEqual(dialog.config.job_profile.profile_keywords, ["c/c++"])
+        self.assertEqual(dialog.config.job_profile.industry_keywords, ["banking", "retail"])
+
+    def test_settings_dialog_returns_same_config_without_edits(self) -> None:
+        config = AppConfig(
+            telegram=TelegramSettings(api_id="12345", api_hash="secret_hash"),
+            job_profile=JobProfileSettings(profile_keywords=["go"]),
+        )
+        dialog = SettingsDialog(config=config)
+        self.addCleanup(_dispose, dialog)
+
+        dialog._handle_save()
+
+        self.assertEqual(dialog.result(), SettingsDialog.DialogCode.Accepted)
+        self.assertIs(dialog.config, config)
 
-        second_dialog = SettingsDialog(config=first_dialog.config)
+    def test_settings_dialog_reports_all_validation_errors_at_once(self) -> None:
+        config = AppConfig()
+        dialog = SettingsDialog(config=config)
+        self.addCleanup(_dispose, dialog)
+        dialog.api_id_input.setText("not-a-number")
+        dialog.phone_input.setText("79990001122")
+
+        with mock.patch("tjr.ui.settings_dialog.QMessageBox.warning") as warning:
+            dialog._handle_save()
+
+        warning.assert_called_once()
+        message = warning.call_args.args[2]
+        self.assertIn("API ID", message)
+        self.assertIn("+79990001122", message)
+        self.assertIs(dialog.config, config)
+
+    def test_settings_validation_errors_need_no_widgets(self) -> None:
+        self.assertEqual(_validation_errors("", "", ""), [])
+        self.assertEqual(_validation_errors("12345", "secret_hash", "+79990001122"), [])
+        self.assertEqual(len(_validation_errors("12a", "short", "79990001122")), 2)
         self.assertEqual(
-            second_dialog.profile_input.toPlainText(),
-            "go / системный анализ / product",
+            _validation_errors("12345", "secret_hash", "8999"),
+            ["Номер Telegram укажите в формате +79990001122."],
         )
 
-        first_dialog.close()
-        second_dialog.close()
+    def test_settings_dialog_reload_refills_fields(self) -> None:
+        dialog = SettingsDialog(config=AppConfig())
+        self.addCleanup(_dispose, dialog)
+        dialog.profile_input.setPlainText("unsaved edit")
+
+        config = AppConfig(
+            telegram=TelegramSettings(api_id="777", api_hash="reloaded_hash"),
+            job_profile=JobProfileSettings(profile_keywords=["go", "rust"]),
+        )
+        dialog.reload(config)
+
+        self.assertIs(dialog.config, config)
+        self.assertEqual(dialog.api_id_input.text(), "777")
+        self.assertEqual(dialog.phone_input.text(), "")
+        self.assertEqual(dialog.profile_input.toPlainText(), "go / rust")
 
 
 class MainWindowSmokeTests(unittest.TestCase):
@@ -105,14 +295,11 @@ class MainWindowSmokeTests(unittest.TestCase):
         cls._app = _ensure_app()
 
     def test_main_window_defaults_match_current_layout(self) -> None:
-        class _DummyConfigStore:
-            def save(self, _config: AppConfig) -> None:
-                return
-
         window = MainWindow(
             config_store=_DummyConfigStore(),
             config=AppConfig(telegram=TelegramSettings(api_id="1", api_hash="abcdefgh")),
         )
+        self.addCleanup(_dispose, window)
         self.assertFalse(window.open_last_report_button.isEnabled())
         self.assertEqual(window.live_matches_value_label.text(), "0")
         self.assertEqual(window.settings_button.text(), "Настройки")
@@ -121,14 +308,13 @@ class MainWindowSmokeTests(unittest.TestCase):
         self.assertEqual(window.scan_status_value_label.text(), "Chat - / -")
         self.assertEqual(window.scan_status_detail_label.text(), "Готово к запуску")
         self.assertEqual(window.sort_toggle_button.text(), "Сортировка: Дата ↓")
-        window.close()
+        self.assertEqual(window.styleSheet(), "")
+        self.assertTrue(window.centralWidget().updatesEnabled())
+        self.assertIn("#LiveCounter", self._app.styleSheet())
 
     def test_main_window_updates_live_match_counter_on_progress(self) -> None:
-        class _DummyConfigStore:
-            def save(self, _config: AppConfig) -> None:
-                return
-
         window = MainWindow(config_store=_DummyConfigStore(), config=AppConfig())
+        self.addCleanup(_dispose, window)
         window._on_scan_progress(
             ScanProgress(
                 phase="message_progress",
@@ -140,15 +326,63 @@ class MainWindowSmokeTests(unittest.TestCase):
                 matched_count=3,
             )
         )
+        self.assertEqual(window.live_matches_value_label.text(), "0")
+        window._flush_scan_progress()
         self.assertEqual(window.live_matches_value_label.text(), "3")
-        window.close()
 
-    def test_main_window_applies_quick_settings(self) -> None:
-        class _DummyConfigStore:
-            def save(self, _config: AppConfig) -> None:
-                return
+    def test_main_window_runs_scan_on_worker_thread(self) -> None:
+        window = MainWindow(config_store=_DummyConfigStore(), config=AppConfig())
+        self.addCleanup(_dispose, window)
+        window.quick_chats_input.setPlainText("@jobs")
+        window.quick_title_input.setPlainText("директор")
+        window._run_chat_scan()
+
+        self.assertTrue(window._is_scanning)
+        self.assertFalse(window.run_button.isEnabled())
+        deadline = time.monotonic() + 10
+        while window._is_scanning and time.monotonic() < deadline:
+            self._app.processEvents()
+            time.sleep(0.01)
+
+        self.assertFalse(window._is_scanning)
+        self.assertTrue(window.run_button.isEnabled())
+        self.assertTrue(window.scan_status_detail_label.text().startswith("Завершено"))
+
+    def test_main_window_close_during_scan_waits_for_worker(self) -> None:
+        window = MainWindow(config_store=_DummyConfigStore(), config=AppConfig())
+        self.addCleanup(_dispose, window)
+        window.quick_chats_input.setPlainText("@jobs")
+        window.quick_title_input.setPlainText("директор")
+        window.show()
+        window._run_chat_scan()
+
+        self.assertFalse(window.close())
+        self.assertTrue(window.isVisible())
+        self.assertTrue(window._cancel_scan_requested.is_set())
+        deadline = time.monotonic() + 10
+        while window.isVisible() and time.monotonic() < deadline:
+            self._app.processEvents()
+            time.sleep(0.01)
+
+        self.assertFalse(window._is_scanning)
+        self.assertFalse(window.isVisible())
+
+    def test_main_window_answers_prompt_with_none_after_stop(self) -> None:
+        window = MainWindow(config_store=_DummyConfigStore(), config=AppConfig())
+        self.addCleanup(_dispose, window)
+        worker = mock.Mock()
+        window._scan_worker = worker
+        window._cancel_scan_requested.set()
+
+        with mock.patch.object(window, "_ask_scan_prompt") as ask:
+            window._on_scan_prompt("code")
+
+        ask.assert_not_called()
+        worker.set_prompt_answer.assert_called_once_with(None)
 
+    def test_main_window_applies_quick_settings(self) -> None:
         window = MainWindow(config_store=_DummyConfigStore(), config=AppConfig())
+        self.addCleanup(_dispose, window)
         window.quick_chats_input.setPlainText("@a\n@b")
         window.quick_title_input.setPlainText("ceo/директор")
         window.quick_depth_input.setValue(21)
@@ -164,34 +398,37 @@ class MainWindowSmokeTests(unittest.TestCase):
         )
         self.assertEqual(window._config.scan_depth_days, 21)
         self.assertEqual(window.depth_days_value_label.text(), "21")
-        window.close()
+
+    def test_main_window_skips_saving_unchanged_quick_settings(self) -> None:
+        saved: list[AppConfig] = []
+
+        class _RecordingConfigStore:
+            def save(self, config: AppConfig) -> None:
+                saved.append(config)
+
+        window = MainWindow(config_store=_RecordingConfigStore(), config=AppConfig(selected_chats=["@a"]))
+        self.addCleanup(_dispose, window)
+        window._apply_quick_settings_inputs(show_feedback=False)
+        self.assertEqual(saved, [])
+
+        window.quick_depth_input.setValue(30)
+        window._apply_quick_settings_inputs(show_feedback=False)
+        self.assertEqual(len(saved), 1)
+        self.assertEqual(window._config.scan_depth_days, 30)
+
+        window._apply_quick_settings_inputs(show_feedback=False)
+        self.assertEqual(len(saved), 1)
 
     def test_main_window_appends_match_to_live_feed(self) -> None:
-        class _DummyConfigStore:
-            def save(self, _config: AppConfig) -> None:
-                return
-
-        match_result = MatchResult(
-            score=1,
-            active_criteria_count=1,
-            excluded=False,
-            matched_title=True,
-            matched_profile=False,
-            matched_industry=False,
-            matched_title_terms=["директор"],
-            matched_profile_terms=[],
-            matched_industry_terms=[],
-            matched_exclusion_terms=[],
-        )
-        record = MatchRecord(
+        record = _record(
             channel="@jobs",
             published_at=datetime(2026, 1, 3, 12, 0, 0),
             text="message text",
             link="https://t.me/jobs/1",
-            match_result=match_result,
         )
 
         window = MainWindow(config_store=_DummyConfigStore(), config=AppConfig())
+        self.addCleanup(_dispose, window)
         window._on_scan_progress(
             ScanProgress(
                 phase="match_found",
@@ -204,37 +441,51 @@ class MainWindowSmokeTests(unittest.TestCase):
                 latest_match=record,
             )
         )
+        window._flush_scan_progress()
         self.assertEqual(window.preview_table.rowCount(), 1)
         self.assertEqual(window.preview_table.item(0, 3).text(), "Open")
-        window.close()
 
-    def test_main_window_feed_ban_button_toggles_ban_list(self) -> None:
-        class _DummyConfigStore:
-            def save(self, _config: AppConfig) -> None:
-                return
-
-        match_result = MatchResult(
-            score=1,
-            active_criteria_count=1,
-            excluded=False,
-            matched_title=True,
-            matched_profile=False,
-            matched_industry=False,
-            matched_title_terms=["директор"],
-            matched_profile_terms=[],
-            matched_industry_terms=[],
-            matched_exclusion_terms=[],
+    def test_main_window_live_feed_inserts_rows_in_date_order(self) -> None:
+        window = MainWindow(config_store=_DummyConfigStore(), config=AppConfig())
+        self.addCleanup(_dispose, window)
+        for day in (2, 3, 1):
+            window._on_scan_progress(
+                ScanProgress(
+                    phase="match_found",
+                    current_chat="@jobs",
+                    current_chat_index=1,
+                    completed_chats=0,
+                    total_chats=1,
+                    scanned_messages=day,
+                    matched_count=day,
+                    latest_match=_record(
+                        channel="@jobs",
+                        published_at=datetime(2026, 1, day, 12, 0, 0),
+                        text=f"message {day}",
+                        link=f"https://t.me/jobs/{day}",
+                    ),
+                )
+            )
+            window._flush_scan_progress()
+
+        self.assertEqual(
+            [window.preview_table.item(row, 1).text() for row in range(window.preview_table.rowCount())],
+            ["2026-01-03 12:00", "2026-01-02 12:00", "2026-01-01 12:00"],
         )
-        record = MatchRecord(
+        self.assertIsNone(window._append_live_match(window._live_feed_records[0]))
+        self.assertEqual(len(window._live_feed_keys), 3)
+
+    def test_main_window_feed_ban_button_toggles_ban_list(self) -> None:
+        record = _record(
             channel="@jobs",
             published_at=datetime(2026, 1, 3, 12, 0, 0),
             text="message text",
             link="https://t.me/jobs/1",
-            match_result=match_result,
         )
 
         window = MainWindow(config_store=_DummyConfigStore(), config=AppConfig())
-        window._refresh_preview_table([record])
+        self.addCleanup(_dispose, window)
+        window._rebuild_preview_table([record])
 
         ban_button = window.preview_table.cellWidget(0, 0)
         self.assertIsNotNone(ban_button)
@@ -243,43 +494,88 @@ class MainWindowSmokeTests(unittest.TestCase):
         self.assertIn(record.link, window._config.banned_message_links)
         ban_button.click()
         self.assertNotIn(record.link, window._config.banned_message_links)
-        window.close()
 
     def test_main_window_opens_cached_report(self) -> None:
-        class _DummyConfigStore:
-            def save(self, _config: AppConfig) -> None:
-                return
-
-        match_result = MatchResult(
-            score=1,
-            active_criteria_count=1,
-            excluded=False,
-            matched_title=True,
-            matched_profile=False,
-            matched_industry=False,
-            matched_title_terms=["директор"],
-            matched_profile_terms=[],
-            matched_industry_terms=[],
-            matched_exclusion_terms=[],
-        )
-        record = MatchRecord(
+        record = _record(
             channel="cached",
             published_at=datetime(2026, 1, 3, 12, 0, 0),
             text="cached text",
             link="https://t.me/cached/1",
-            match_result=match_result,
         )
 
         window = MainWindow(config_store=_DummyConfigStore(), config=AppConfig())
+        self.addCleanup(_dispose, window)
         window._last_report_records = [record]
         window.open_last_report_button.setEnabled(True)
         window._open_last_report()
 
         self.assertIsNotNone(window._results_dialog)
         if window._results_dialog is not None:
-            self.assertEqual(window._results_dialog.table.rowCount(), 1)
+            self.assertEqual(window._results_dialog.table.model().rowCount(), 1)
             window._results_dialog.close()
-        window.close()
+
+        first_dialog = window._results_dialog
+        window._last_report_records = [record, record]
+        window._open_last_report()
+        self.assertIs(window._results_dialog, first_dialog)
+        if window._results_dialog is not None:
+            self.assertEqual(window._results_dialog.table.model().rowCount(), 2)
+            self.assertEqual(window._results_dialog.count_label.text(), "Найдено совпадений: 2")
+            window._results_dialog.close()
+
+    def test_main_window_report_reflects_bans_changed_in_live_feed(self) -> None:
+        record = _record(
+            channel="@jobs",
+            published_at=datetime(2026, 1, 3, 12, 0, 0),
+            text="message text",
+            link="https://t.me/jobs/1",
+        )
+
+        window = MainWindow(config_store=_DummyConfigStore(), config=AppConfig())
+        self.addCleanup(_dispose, window)
+        window._last_report_records = [record]
+        window._open_last_report()
+        dialog = window._results_dialog
+        assert dialog is not None
+        model = dialog.table.model()
+        index = model.index(0, 0)
+
+        model.setData(index, Qt.Checked, Qt.CheckStateRole)
+        self.assertIn(record.link, window._config.banned_message_links)
+        dialog.close()
+
+        window._rebuild_preview_table([record])
+        window.preview_table.cellWidget(0, 0).click()
+        self.assertNotIn(record.link, window._config.banned_message_links)
+        window._open_last_report()
+
+        self.assertIs(window._results_dialog, dialog)
+        self.assertEqual(Qt.CheckState(index.data(Qt.CheckStateRole)), Qt.Unchecked)
+        dialog.close()
+
+    def test_main_window_reopened_report_repaints_ban_checks(self) -> None:
+        record = _record(
+            channel="@jobs",
+            published_at=datetime(2026, 1, 3, 12, 0, 0),
+            text="message text",
+            link="https://t.me/jobs/1",
+        )
+
+        window = MainWindow(config_store=_DummyConfigStore(), config=AppConfig())
+        self.addCleanup(_dispose, window)
+        window._last_report_records = [record]
+        window._open_last_report()
+        dialog = window._results_dialog
+        assert dialog is not None
+        dialog.close()
+        changed: list[list[int]] = []
+        dialog.table.model().dataChanged.connect(lambda _top, _bottom, roles: changed.append(list(roles)))
+
+        window._ban_message_link(record.link, True)
+        window._open_last_report()
+
+        self.assertIn([Qt.CheckStateRole], changed)
+        dialog.close()
 
 
 class ResultsWindowSmokeTests(unittest.TestCase):
@@ -287,83 +583,117 @@ class ResultsWindowSmokeTests(unittest.TestCase):
     def setUpClass(cls) -> None:
         cls._app = _ensure_app()
 
+    def _open_dialog(self, records: list[MatchRecord], **kwargs) -> MatchResultsDialog:
+        # Disposed by cleanup, so a failed assertion does not leave the dialog alive for later tests.
+        dialog = MatchResultsDialog(records=records, **kwargs)
+        self.addCleanup(_dispose, dialog)
+        return dialog
+
     def test_results_window_switches_date_sort_order(self) -> None:
-        match_result = MatchResult(
-            score=1,
-            active_criteria_count=1,
-            excluded=False,
-            matched_title=True,
-            matched_profile=False,
-            matched_industry=False,
-            matched_title_terms=["директор"],
-            matched_profile_terms=[],
-            matched_industry_terms=[],
-            matched_exclusion_terms=[],
-        )
-        old_record = MatchRecord(
+        old_record = _record(
             channel="old",
             published_at=datetime(2026, 1, 1, 12, 0, 0),
             text="old text",
             link="https://t.me/old/1",
-            match_result=match_result,
         )
-        new_record = MatchRecord(
+        new_record = _record(
             channel="new",
             published_at=datetime(2026, 1, 2, 12, 0, 0),
             text="new text",
             link="https://t.me/new/1",
-            match_result=match_result,
         )
-        dialog = MatchResultsDialog(records=[old_record, new_record])
+        dialog = self._open_dialog([old_record, new_record])
 
         self.assertTrue(hasattr(dialog.table, "_smooth_wheel_scroller"))
-        self.assertEqual(dialog.table.item(0, 4).text(), "new")
-        dialog.sort_combo.setCurrentIndex(1)
-        self.assertEqual(dialog.table.item(0, 4).text(), "old")
-
-        dialog.close()
+        self.assertEqual(dialog.table.model().index(0, 4).data(), "new")
+        with mock.patch("tjr.ui.results_window.extract_lemmas") as extract:
+            dialog.sort_combo.setCurrentIndex(1)
+        self.assertEqual(dialog.table.model().index(0, 4).data(), "old")
+        self.assertEqual(dialog.table.model().index(0, 5).data(), "Название: директор")
+        extract.assert_not_called()
+
+    def test_highlight_text_escapes_gaps_and_marks_matching_words(self) -> None:
+        html_text = _highlight_text("Директор <b> & директора", frozenset({"директор"}))
+
+        self.assertEqual(html_text.count("<span"), 2)
+        self.assertIn("&lt;b&gt; &amp; ", html_text)
+        self.assertIn(">директора</span>", html_text)
+        self.assertNotIn("<span", _highlight_text("a < b", frozenset({"директор"})))
+
+    def test_results_window_builds_row_widgets_lazily(self) -> None:
+        records = [
+            _record(
+                channel="chan",
+                published_at=datetime(2026, 1, 1, 12, index % 60, 0),
+                text=f"text {index}",
+                link=f"https://t.me/chan/{index}",
+            )
+            for index in range(200)
+        ]
+        dialog = self._open_dialog(records)
+        dialog.show()
+
+        last_row = dialog.table.model().rowCount() - 1
+        self.assertIsNotNone(dialog.table.indexWidget(dialog.table.model().index(0, 2)))
+        self.assertIsNone(dialog.table.indexWidget(dialog.table.model().index(last_row, 2)))
+        self.assertLess(len(dialog._materialized), 200)
+
+        scrollbar = dialog.table.verticalScrollBar()
+        # Materialized rows are taller than placeholders, so the range grows while scrolling.
+        for _ in range(20):
+            scrollbar.setValue(scrollbar.maximum())
+            self._app.processEvents()
+            if dialog.table.indexWidget(dialog.table.model().index(last_row, 2)) is not None:
+                break
+        self.assertIsNotNone(dialog.table.indexWidget(dialog.table.model().index(last_row, 2)))
+
+    def test_xlsx_export_runnable_writes_workbook(self) -> None:
+        from openpyxl import load_workbook
+
+        record = _record(
+            channel="chan",
+            published_at=datetime(2026, 1, 2, 12, 0, 0),
+            text="text",
+            link="https://t.me/chan/1",
+        )
+        finished: list[str] = []
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = str(Path(tmp_dir) / "report.xlsx")
+            job = XlsxExportRunnable(path, [record])
+            job.signals.finished.connect(finished.append)
+            job.run()
+
+            self.assertEqual(finished, [path])
+            rows = list(load_workbook(path).active.iter_rows(values_only=True))
+        self.assertEqual(rows[0][0], "Дата")
+        self.assertEqual(rows[1], ("2026-01-02 12:00:00", "text", "https://t.me/chan/1", "chan", "Название: директор"))
 
     def test_results_window_ban_checkbox_is_two_way(self) -> None:
         events: list[tuple[str, bool]] = []
-        match_result = MatchResult(
-            score=1,
-            active_criteria_count=1,
-            excluded=False,
-            matched_title=True,
-            matched_profile=False,
-            matched_industry=False,
-            matched_title_terms=["директор"],
-            matched_profile_terms=[],
-            matched_industry_terms=[],
-            matched_exclusion_terms=[],
-        )
-        record = MatchRecord(
+        record = _record(
             channel="chan",
             published_at=datetime(2026, 1, 2, 12, 0, 0),
             text="text",
             link="https://t.me/chan/1",
-            match_result=match_result,
         )
-        dialog = MatchResultsDialog(
-            records=[record],
+        dialog = self._open_dialog(
+            [record],
             on_ban_message=lambda link, is_banned: events.append((link, is_banned)),
         )
-        wrapper = dialog.table.cellWidget(0, 0)
-        self.assertIsNotNone(wrapper)
-        checkbox = wrapper.findChild(QCheckBox) if wrapper is not None else None
-        self.assertIsNotNone(checkbox)
+        model = dialog.table.model()
+        index = model.index(0, 0)
+        self.assertIsNone(dialog.table.indexWidget(index))
+        self.assertTrue(index.flags() & Qt.ItemIsUserCheckable)
 
-        checkbox.setChecked(True)
-        checkbox.setChecked(False)
+        model.setData(index, Qt.Checked, Qt.CheckStateRole)
+        self.assertEqual(events, [("https://t.me/chan/1", True)])
 
-        self.assertEqual(
-            events,
-            [
-                ("https://t.me/chan/1", True),
-                ("https://t.me/chan/1", False),
-            ],
-        )
-        dialog.close()
+        dialog.sort_combo.setCurrentIndex(1)
+        index = model.index(0, 0)
+        self.assertEqual(Qt.CheckState(index.data(Qt.CheckStateRole)), Qt.Checked)
+        model.setData(index, Qt.Checked, Qt.CheckStateRole)
+        model.setData(index, Qt.Unchecked, Qt.CheckStateRole)
+        self.assertEqual(events, [("https://t.me/chan/1", True), ("https://t.me/chan/1", False)])
 
 
 if __name__ == "__main__":